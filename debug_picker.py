@@ -31,13 +31,14 @@ if __name__ == "__main__":
         print(f"Generated {len(picks)} picks.")
         
         # Check missing data log
-        with db.connect() as con:
-            missing = con.execute("SELECT ticker, stage, reason, detail FROM weekly_pick_missing ORDER BY ts DESC LIMIT 10").fetchall()
+        with db.session() as con:
+            missing = con.execute(
+                "SELECT '  ' || ticker || ' | ' || stage || ' | ' || reason || ' | ' || COALESCE(detail, 'None') "
+                "FROM weekly_pick_missing ORDER BY ts DESC LIMIT 10"
+            ).fetchall()
         
         if missing:
-            print("\nLatest Missing Data Logs:")
-            for m in missing:
-                print(f"  {m[0]} | {m[1]} | {m[2]} | {m[3]}")
+            sys.stdout.write("\nLatest Missing Data Logs:\n" + "\n".join(m[0] for m in missing) + "\n")
                 
     except Exception as e:
         print(f"Picker crashed: {e}")
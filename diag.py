@@ -4,14 +4,19 @@ import os
 db = get_db("data/sqlite/tracker.db")
 print(f"DB exists: {os.path.exists(db.path)}")
 
-with db.connect() as con:
-    universe = con.execute("SELECT count(*) FROM universe").fetchone()[0]
-    oced = con.execute("SELECT count(*) FROM oced_scores").fetchone()[0]
-    picks = con.execute("SELECT count(*) FROM weekly_picks").fetchone()[0]
-    health = con.execute("SELECT count(*) FROM option_features").fetchone()[0]
-    prices = con.execute("SELECT count(*) FROM market_last").fetchone()[0]
-    contracts = con.execute("SELECT count(*) FROM options_contracts").fetchone()[0]
-    
+with db.session() as con:
+    universe, oced, picks, health, prices, contracts = con.execute(
+        """
+        SELECT
+          (SELECT count(*) FROM universe),
+          (SELECT count(*) FROM oced_scores),
+          (SELECT count(*) FROM weekly_picks),
+          (SELECT count(*) FROM option_features),
+          (SELECT count(*) FROM market_last),
+          (SELECT count(*) FROM options_contracts)
+        """
+    ).fetchone()
+
 print(f"Universe: {universe}")
 print(f"OCED Scores: {oced}")
 print(f"Weekly Picks: {picks}")
@@ -22,11 +27,9 @@ print(f"Options Contracts: {contracts}")
 if oced > 0:
     print("\nSample OCED Scores (Latest):")
     rows = con.execute("SELECT ticker, ts, CoveredCall_Suitability FROM oced_scores ORDER BY ts DESC LIMIT 5").fetchall()
-    for r in rows:
-        print(f"  {r}")
+    print("\n".join(f"  {r}" for r in rows))
 
 if prices > 0:
     print("\nSample Prices:")
     rows = con.execute("SELECT ticker, price, ts FROM market_last LIMIT 5").fetchall()
-    for r in rows:
-        print(f"  {r}")
+    print("\n".join(f"  {r}" for r in rows))
@@ -1,4 +1,3 @@
-import pandas as pd
 from massive_tracker.flatfile_manager import FlatfileManager
 from massive_tracker.oced import run_oced_scan
 from massive_tracker.store import get_db
@@ -11,7 +10,7 @@ def diagnose():
     db = get_db(db_path)
     
     print("Checking Universe...")
-    with db.connect() as con:
+    with db.session() as con:
         enabled = con.execute("SELECT ticker FROM universe WHERE enabled=1").fetchall()
         print(f"Enabled tickers: {[r[0] for r in enabled]}")
         
@@ -23,14 +22,13 @@ def diagnose():
     print(f"\nTesting ticker: {ticker}")
     
     mgr = FlatfileManager(db_path=db_path)
-    print(f"Flatfile path: {mgr.flatfile_dir / f'{ticker}.csv'}")
+    print(f"Flatfile dir: {mgr.flatfile_dir / f'ticker={ticker}'}")
     
-    # Check if file exists and has data
-    if (mgr.flatfile_dir / f"{ticker}.csv").exists():
-        df = pd.read_csv(mgr.flatfile_dir / f"{ticker}.csv")
-        print(f"Existing bars for {ticker}: {len(df)}")
-        if not df.empty:
-             print(f"Last timestamp: {df['timestamp'].max()}")
+    # Row count and last bar come from Parquet footer statistics; no rows are decoded
+    n_bars, _, last_ts = mgr.get_bar_stats(ticker)
+    if n_bars:
+        print(f"Existing bars for {ticker}: {n_bars}")
+        print(f"Last timestamp: {last_ts}")
     else:
         print(f"No flatfile for {ticker} yet.")
 
@@ -50,7 +48,7 @@ def diagnose():
         # run_oced_scan runs for all tickers, let's see if it produces scores
         run_oced_scan(db_path=db_path)
         
-        with db.connect() as con:
+        with db.session() as con:
             scores = con.execute("SELECT * FROM oced_scores WHERE ticker=? ORDER BY ts DESC LIMIT 1", (ticker,)).fetchone()
             print(f"OCED Score for {ticker}: {scores}")
     else:
@@ -1,7 +1,12 @@
 import requests
 import json
+from requests.adapters import HTTPAdapter
 from massive_tracker.config import CFG
 
+# One pooled session so the calls below reuse the TCP/TLS connection to api.massive.com
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def live_fire_json():
     print("=== LIVE FIRE: RAPID PROTOTYPE JSON ===\n")
     
@@ -9,7 +14,7 @@ def live_fire_json():
     print("--- ONE ROW: AAPL STOCK (Daily Agg) ---")
     params = {'apiKey': CFG.massive_api_key, 'limit': 1}
     # Using a past date range to ensure we get a result even on a holiday
-    r_stock = requests.get('https://api.massive.com/v2/aggs/ticker/AAPL/range/1/day/2024-12-01/2024-12-01', params=params)
+    r_stock = SESSION.get('https://api.massive.com/v2/aggs/ticker/AAPL/range/1/day/2024-12-01/2024-12-01', params=params, timeout=10)
     if r_stock.status_code == 200:
         data = r_stock.json()
         results = data.get("results", [])
@@ -31,7 +36,7 @@ def live_fire_json():
     # 2. ONE ROW OF OPTION DATA
     print("--- ONE ROW: AAPL OPTION (Reference) ---")
     params_opt = {'apiKey': CFG.massive_api_key, 'underlying_ticker': 'AAPL', 'limit': 1}
-    r_opt = requests.get('https://api.massive.com/v3/reference/options/contracts', params=params_opt)
+    r_opt = SESSION.get('https://api.massive.com/v3/reference/options/contracts', params=params_opt, timeout=10)
     if r_opt.status_code == 200:
         data = r_opt.json()
         results = data.get("results", [])
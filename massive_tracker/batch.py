@@ -5,6 +5,7 @@ from typing import Optional
 from .config import load_flatfile_config
 from .store import get_db
 from .ingest import ingest_daily
+from .s3_flatfiles import get_s3
 from .weekly_rollup import run_weekly_rollup
 
 @dataclass
@@ -19,7 +20,7 @@ def run_batch(args: BatchArgs) -> None:
         cfg = load_flatfile_config(required=False)
         if cfg is None:
             raise RuntimeError("Missing flatfile credentials; cannot ingest without MASSIVE_ACCESS_KEY/AWS_ACCESS_KEY_ID and MASSIVE_SECRET_KEY/AWS_SECRET_ACCESS_KEY")
-        ingest_daily(cfg, get_db(args.db_path), args.date)
+        ingest_daily(cfg, get_db(args.db_path), args.date, s3=get_s3(cfg))
 
     if args.rollup:
         run_weekly_rollup()
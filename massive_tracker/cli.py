@@ -1,50 +1,90 @@
 import sys
 import os
 from pathlib import Path
-from datetime import datetime, timezone
-from .flatfile_manager import FlatfileManager
+from datetime import datetime, timedelta, timezone
 
-# Ensure local module imports work when running: python cli.py ...
-ROOT = Path(__file__).resolve().parent
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+
+def _fast_help() -> str:
+    """Top-level --help built from this file's source, so it needs neither typer nor rich."""
+    import ast
+
+    tree = ast.parse(Path(__file__).read_text(encoding="utf-8"))
+    lines = ["Usage: cli.py [OPTIONS] COMMAND [ARGS]...", "", "Commands:"]
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and any(
+            ast.unparse(d) == "app.command()" for d in node.decorator_list
+        ):
+            doc = (ast.get_docstring(node) or "").strip().splitlines()
+            lines.append(f"  {node.name.replace('_', '-'):<30} {doc[0] if doc else ''}".rstrip())
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__" and sys.argv[1:] in (["-v"], ["--version"]):
+    from . import __version__
+    sys.stdout.write(f"massive_tracker {__version__}\n")
+    raise SystemExit(0)
+
+if __name__ == "__main__" and sys.argv[1:] in (["--help"], ["-h"]):
+    sys.stdout.write(_fast_help())
+    raise SystemExit(0)
 
 import typer
-from rich import print
 
-# NOTE: root-level modules => NO relative imports (no leading dots)
-from .config import load_flatfile_config, load_runtime_config, print_key_status
+if sys.stdout.isatty():
+    from rich import print
+    from rich.markup import escape
+else:
+    # Piped/cron/CI output: skip importing rich and drop its [style] tags (same tag shape rich parses).
+    import builtins
+    import re
+
+    _RICH_TAG = re.compile(r"\[[a-z#/@][^\[]*?\]")
+
+    def print(*objects, **kwargs):
+        builtins.print(*(_RICH_TAG.sub("", o) if isinstance(o, str) else o for o in objects), **kwargs)
+
+from .config import CFG, load_flatfile_config, print_key_status
 from .store import get_db
 from .watchlist import Watchlists
 
-from .ingest import ingest_daily
-from .weekly_rollup import run_weekly_rollup
-from .picker import run_weekly_picker
-from .stock_ml import run_stock_ml
-from .oced import run_oced_scan
-from .promotion import promote_from_weekly_picks
-from .flatfiles import download_range, load_option_file, load_stock_file
-from .flatfiles import download_range, load_option_file, load_stock_file
-from .massive_client import get_stock_last_price, get_option_chain_snapshot, get_options_contracts
-from .universe import sync_universe, get_universe
-from .summary import write_summary
-from .covered_calls import rank_covered_calls, next_fridays, load_spot_map, save_results
-from .report_monday import write_monday_report
-from .weekly_close import write_weekly_scorecard
-from .compare_models import run_compare
-
-from .wizard import run_wizard
-from .run import run_once
 
 app = typer.Typer(add_completion=False)
 
 
+def _print_rows(rows) -> None:
+    """Emit rows in a single write; rich formatting only when attached to a terminal."""
+    if not rows:
+        return
+    text = "\n".join(map(str, rows))
+    if sys.stdout.isatty():
+        print(escape(text))
+    else:
+        sys.stdout.write(text + "\n")
+
+
+def _split_csv(arg: str) -> list[str]:
+    """Upper-cased, non-empty items of a comma-separated ticker argument."""
+    return [t for t in (part.strip().upper() for part in arg.split(",")) if t]
+
+
+def _next_friday() -> str:
+    """This week's Friday (today if Friday) in UTC, as YYYY-MM-DD; one clock read, no midnight skew."""
+    now = datetime.now(timezone.utc)
+    return (now + timedelta(days=(4 - now.weekday()) % 7)).strftime("%Y-%m-%d")
+
+
 @app.command()
 def init(db_path: str = "data/sqlite/tracker.db"):
-    """Initialize local DB and folders."""
-    get_db(db_path).connect().close()
+    """Initialize local DB and folders.
+
+    Opening the DB applies store.PRAGMAS (WAL, synchronous=NORMAL, in-memory
+    temp store, larger page cache and mmap); journal_mode=WAL persists in the
+    file, so every later command starts in WAL mode.
+    """
+    from .universe import sync_universe
+    db = get_db(db_path)
+    db.connect()
     try:
-        db = get_db(db_path)
         synced = sync_universe(db)
         print(f"[green]Universe synced[/green] rows={synced}")
     except Exception as e:
@@ -60,6 +100,7 @@ def wizard(db_path: str = "data/sqlite/tracker.db"):
     - Allows add/remove/close
     - Saves run defaults
     """
+    from .wizard import run_wizard
     run_wizard(db_path=db_path)
     print(
         "[bold green]Wizard complete.[/bold green]\n\n"
@@ -72,9 +113,11 @@ def wizard(db_path: str = "data/sqlite/tracker.db"):
 
 @app.command()
 def add_ticker(ticker: str, db_path: str = "data/sqlite/tracker.db"):
+    """Enable a ticker, or a comma-separated list of tickers in one transaction."""
+    tickers = _split_csv(ticker)
     wl = Watchlists(get_db(db_path))
-    wl.add_ticker(ticker)
-    print(f"[green]Added ticker[/green] {ticker.upper()}")
+    wl.add_tickers(tickers)
+    print(f"[green]Added ticker[/green] {', '.join(tickers)}")
 
 
 @app.command()
@@ -86,8 +129,7 @@ def oced_status(db_path: str = "data/sqlite/tracker.db"):
     stats = db.get_oced_stats()
     top = db.get_latest_oced_top(n=10)
     print(stats)
-    for r in top:
-        print(r)
+    _print_rows(top)
 
 
 @app.command()
@@ -99,39 +141,41 @@ def ml_status(db_path: str = "data/sqlite/tracker.db"):
 @app.command()
 def stock_ml(db_path: str = "data/sqlite/tracker.db", lookback_days: int = 500):
     """Compute stock-only ML signals (vol/regime/expected move) and store results."""
+    from .stock_ml import run_stock_ml
     rows = run_stock_ml(db_path=db_path, lookback_days=lookback_days)
     print(f"[green]Computed stock ML[/green] -> stock_ml_signals ({len(rows)} rows)")
 
 
+# Last-known universe used by seed_universe (already upper-case).
+_SEED_UNIVERSE: tuple[str, ...] = (
+    # ETFs
+    "SPY", "QQQ", "DIA", "IWM", "XLF", "XLE", "XLK",
+    # Core tech / large
+    "AAPL", "MSFT", "GOOG", "AMZN", "META", "NVDA",
+    # Semi / chips
+    "TSM", "AVGO", "ASML", "TXN", "ARM", "MRVL",
+    # Financial / infra
+    "BAC", "WFC", "CSCO", "IBM", "PYPL",
+    # Platform / growth / fintech
+    "UBER", "SHOP", "SOFI", "HOOD", "AFRM", "PLTR",
+    # Crypto / miners / exchange
+    "COIN", "RIOT", "MARA",
+    # EV
+    "TSLA", "RIVN",
+    # Small/spec
+    "CLOV",
+)
+
+
 @app.command()
 def seed_universe(db_path: str = "data/sqlite/tracker.db"):
     """
     Seed the watchlist with the last-known universe set (from prior OCED tables).
     Safe to run multiple times (upsert behavior).
     """
-    universe = [
-        # ETFs
-        "SPY", "QQQ", "DIA", "IWM", "XLF", "XLE", "XLK",
-        # Core tech / large
-        "AAPL", "MSFT", "GOOG", "AMZN", "META", "NVDA",
-        # Semi / chips
-        "TSM", "AVGO", "ASML", "TXN", "ARM", "MRVL",
-        # Financial / infra
-        "BAC", "WFC", "CSCO", "IBM", "PYPL",
-        # Platform / growth / fintech
-        "UBER", "SHOP", "SOFI", "HOOD", "AFRM", "PLTR",
-        # Crypto / miners / exchange
-        "COIN", "RIOT", "MARA",
-        # EV
-        "TSLA", "RIVN",
-        # Small/spec
-        "CLOV",
-    ]
-
     wl = Watchlists(get_db(db_path))
-    for t in universe:
-        wl.add_ticker(t)
-    print(f"[green]Seeded universe[/green] {len(universe)} tickers -> tickers table")
+    wl.add_tickers(_SEED_UNIVERSE)
+    print(f"[green]Seeded universe[/green] {len(_SEED_UNIVERSE)} tickers -> tickers table")
 
 
 @app.command()
@@ -156,9 +200,12 @@ def pick_covered_calls(
     db_path: str = "data/sqlite/tracker.db",
 ):
     """Rank near-term covered-call candidates across the universe."""
+    from .universe import get_universe
+    from .summary import write_summary
+    from .covered_calls import rank_covered_calls, next_fridays, load_spot_map, save_results
 
     universe = get_universe()
-    tlist = [t.strip().upper() for t in tickers.split(",") if t.strip()] if tickers else universe
+    tlist = _split_csv(tickers) if tickers else universe
     elist = [e.strip() for e in expiries.split(",") if e.strip()] if expiries else next_fridays(2)
 
     spot_map = load_spot_map(db_path, tlist)
@@ -179,9 +226,7 @@ def list_watch(db_path: str = "data/sqlite/tracker.db"):
 @app.command()
 def list_contracts(db_path: str = "data/sqlite/tracker.db"):
     wl = Watchlists(get_db(db_path))
-    rows = wl.list_open_contracts()
-    for r in rows:
-        print(r)
+    _print_rows(wl.list_open_contracts())
 
 
 @app.command()
@@ -192,6 +237,7 @@ def ingest(
     download_options: bool = False,
 ):
     """Ingest daily aggregates (stocks; optionally options) for YYYY-MM-DD."""
+    from .ingest import ingest_daily
     cfg = load_flatfile_config(required=True)
     out = ingest_daily(
         cfg,
@@ -203,23 +249,78 @@ def ingest(
     print(f"[green]Ingested[/green] {out}")
 
 
+@app.command()
+def ingest_range(
+    start: str,
+    end: str,
+    db_path: str = "data/sqlite/tracker.db",
+    workers: int = 8,
+    universe_only: bool = False,
+):
+    """Ingest stock day aggregates for every weekday in [START, END], downloading days in parallel."""
+    from .ingest import ingest_range as ingest_flatfile_range
+    cfg = load_flatfile_config(required=True)
+    universe = _universe_filter(db_path) if universe_only else None
+    dates = ingest_flatfile_range(cfg, get_db(db_path), start, end, workers=workers, universe=universe)
+    if not dates:
+        print(f"[yellow]No flatfiles available[/yellow] {start}..{end}")
+        return
+    print(f"[green]Ingested[/green] {len(dates)} days ({dates[0]}..{dates[-1]})")
+
+
+def _is_day_aggs(dataset: str) -> bool:
+    """Only day-aggregate datasets belong in the per-ticker day Parquet layout."""
+    return "day_aggs" in dataset
+
+
+def _universe_filter(db_path: str) -> Path | None:
+    """Refresh the universe Parquet snapshot once per command; None (no filter) if the universe is empty."""
+    from .flatfiles import export_universe_parquet, UNIVERSE_PARQUET
+    if not export_universe_parquet(db_path):
+        print("[yellow]Universe is empty; loading all tickers[/yellow]")
+        return None
+    return UNIVERSE_PARQUET
+
+
 @app.command()
 def flatfile_download(
     dataset: str = "us_options_opra/day_aggs_v1",
     date: str = "2025-12-18",
     db_path: str = "data/sqlite/tracker.db",
     load: bool = True,
+    direct: bool = False,
+    universe_only: bool = False,
 ):
-    """Download a single Massive flatfile and optionally load into sqlite."""
-    paths = download_range(dataset, date, date)
+    """
+    Download a single Massive flatfile and optionally load into sqlite.
+    --direct reads a stocks file straight from S3 (DuckDB httpfs), skipping the local .csv.gz.
+    --universe-only keeps stock rows for enabled universe tickers only.
+    """
+    from .flatfiles import download_range, load_option_file, load_stock_day_file, load_stock_file, s3_url
+    universe = _universe_filter(db_path) if universe_only else None
+    is_stocks = "us_stocks" in dataset or "stocks" in dataset
+    if direct and load and is_stocks:
+        cfg = load_flatfile_config(required=True)
+        loaded = load_stock_file(s3_url(dataset, date, cfg), db_path, ts_hint=date, universe=universe, cfg=cfg)
+        print(f"[green]Loaded from S3[/green] rows={loaded}")
+        return
+
+    # A file already on disk is reloaded so a rerun recovers from a failed load.
+    paths = download_range(dataset, date, date, include_existing=load)
     loaded = 0
+    db = get_db(db_path)
     for p in paths:
-        if load:
-            if "us_stocks" in dataset or "stocks" in dataset:
-                loaded += load_stock_file(Path(p), db_path, ts_hint=date)
+        if not load:
+            continue
+        # One transaction per file: a failure rolls back only that file.
+        with db.session() as db_con:
+            if is_stocks and _is_day_aggs(dataset):
+                loaded += load_stock_day_file(Path(p), db_path, date, universe=universe, db_con=db_con)[0]
+            elif is_stocks:
+                loaded += load_stock_file(Path(p), db_path, ts_hint=date, universe=universe, db_con=db_con)
             else:
                 table = "option_bars_1d" if "day" in dataset else "option_bars_1m"
-                loaded += load_option_file(Path(p), db_path, table, ts_hint=date)
+                loaded += load_option_file(Path(p), db_path, table, ts_hint=date, db_con=db_con)
     print(f"[green]Downloaded[/green] {len(paths)} files; loaded rows={loaded}")
 
 
@@ -230,19 +331,45 @@ def flatfile_backfill(
     end: str = "2025-12-18",
     db_path: str = "data/sqlite/tracker.db",
     load: bool = True,
+    universe_only: bool = False,
+    drop_indexes: bool = False,
+    workers: int = 8,
 ):
-    """Backfill a date range; downloads missing files only."""
-    paths = download_range(dataset, start, end)
+    """Backfill a date range; downloads missing files only.
+
+    Downloads run on --workers threads and each day is loaded as soon as it lands,
+    in its own transaction. With --load, files already on disk are reloaded too
+    (loads are upserts), so rerunning after a failure fills the days it missed.
+    --drop-indexes drops the option bar table's secondary indexes for the load
+    and rebuilds them once at the end (only for ranges of 3+ days).
+    """
+    from contextlib import nullcontext
+    from datetime import date
+    from .flatfiles import iter_download_range, load_option_file, load_stock_day_file, load_stock_file
+    universe = _universe_filter(db_path) if universe_only else None
+    is_stocks = "us_stocks" in dataset or "stocks" in dataset
+    table = "option_bars_1d" if "day" in dataset else "option_bars_1m"
+    span_days = (date.fromisoformat(end) - date.fromisoformat(start)).days + 1
+    defer = load and drop_indexes and not is_stocks and span_days >= 3
+    files = 0
     loaded = 0
-    for p in paths:
-        if load:
-            ts_hint = p.stem  # YYYY-MM-DD
-            if "us_stocks" in dataset or "stocks" in dataset:
-                loaded += load_stock_file(Path(p), db_path, ts_hint=ts_hint)
-            else:
-                table = "option_bars_1d" if "day" in dataset else "option_bars_1m"
-                loaded += load_option_file(Path(p), db_path, table, ts_hint=ts_hint)
-    print(f"[green]Backfill complete[/green] files={len(paths)} rows_loaded={loaded}")
+    db = get_db(db_path)
+    with db.deferred_indexes(table) if defer else nullcontext():
+        for p in iter_download_range(dataset, start, end, workers=workers, include_existing=load):
+            files += 1
+            if not load:
+                continue
+            ts_hint = p.name.split(".", 1)[0]  # YYYY-MM-DD from YYYY-MM-DD.csv.gz
+            # Commit per day: a failure only rolls back that day, and the WAL can
+            # checkpoint between days instead of growing for the whole range.
+            with db.session() as db_con:
+                if is_stocks and _is_day_aggs(dataset):
+                    loaded += load_stock_day_file(Path(p), db_path, ts_hint, universe=universe, db_con=db_con)[0]
+                elif is_stocks:
+                    loaded += load_stock_file(Path(p), db_path, ts_hint=ts_hint, universe=universe, db_con=db_con)
+                else:
+                    loaded += load_option_file(Path(p), db_path, table, ts_hint=ts_hint, db_con=db_con)
+    print(f"[green]Backfill complete[/green] files={files} rows_loaded={loaded}")
 
 
 @app.command()
@@ -257,7 +384,17 @@ def refresh_contracts(
     db_path: str = "data/sqlite/tracker.db",
 ):
     """Fetch options contracts from Massive REST and cache into sqlite."""
-
+    from .massive_client import get_options_contracts
+
+    params = {
+        "underlying_ticker": underlying or None,
+        "expiration_date": expiration_date or None,
+        "contract_type": contract_type or None,
+        "expired": str(expired).lower(),
+        "limit": limit,
+        "sort": sort,
+        "order": order,
+    }
     rows = get_options_contracts(**params)
     db = get_db(db_path)
     cached = db.upsert_options_contracts(rows)
@@ -274,6 +411,7 @@ def compare(
     top_n: int = 10,
 ):
     """Run side-by-side model compare and save report."""
+    from .compare_models import run_compare
     out = run_compare(db_path=db_path, seed=seed, top_n=top_n)
     print(f"[green]Compare done[/green] -> data/reports/model_compare.json changes={len(out.get('decision_changes', []))}")
 
@@ -286,8 +424,11 @@ def daily(
     top_n: int = 3,
 ):
     """One-shot daily flow: sync universe -> picker -> promote -> monitor -> summary."""
-    db = get_db(db_path)
-    sync_universe(db)
+    from .picker import run_weekly_picker
+    from .promotion import promote_from_weekly_picks
+    from .summary import write_summary
+    from .monitor import run_monitor
+    # run_weekly_picker syncs the universe itself.
     picks = run_weekly_picker(db_path=db_path, top_n=10)
     promote_from_weekly_picks(db_path=db_path, seed=seed, lane=lane, top_n=top_n)
     run_monitor(db_path=db_path)
@@ -298,6 +439,7 @@ def daily(
 @app.command()
 def rollup():
     """Generate CSV reports from JSONL logs."""
+    from .weekly_rollup import run_weekly_rollup
     run_weekly_rollup()
     print("[green]Rollup complete[/green] -> data/reports/")
 
@@ -305,6 +447,7 @@ def rollup():
 @app.command()
 def summary(db_path: str = "data/sqlite/tracker.db", seed: float = 9300.0):
     """Generate markdown summary (DB-first)."""
+    from .summary import write_summary
     md = write_summary(db_path=db_path, seed=seed)
     print(f"[green]Summary written[/green] -> data/reports/summary.md ({len(md.splitlines())} lines)")
 
@@ -312,10 +455,10 @@ def summary(db_path: str = "data/sqlite/tracker.db", seed: float = 9300.0):
 @app.command()
 def picker(db_path: str = "data/sqlite/tracker.db", top_n: int = 5):
     """Emit weekly picks into weekly_picks table."""
+    from .picker import run_weekly_picker
     print_key_status()
     print("")
     
-    sync_universe(get_db(db_path))
     picks = run_weekly_picker(db_path=db_path, top_n=top_n)
     print(f"[green]Wrote picks[/green] to weekly_picks ({len(picks)} rows)")
 
@@ -347,13 +490,15 @@ def env_check():
 @app.command()
 def smoke(db_path: str = "data/sqlite/tracker.db"):
     """Smoke test Massive pricing + picker math/provenance."""
-    from datetime import datetime, timedelta
+    from .picker import run_weekly_picker
+    from .massive_client import get_option_chain_snapshot
+    from .universe import sync_universe
 
     print_key_status()
     print("")
 
     db = get_db(db_path)
-    db.connect().close()
+    db.connect()
     sync_universe(db)
     tickers = [t for t, _ in db.list_universe(enabled_only=True)]
     if not tickers:
@@ -370,13 +515,12 @@ def smoke(db_path: str = "data/sqlite/tracker.db"):
 
     price_rows = []
     missing_cache = []
-    for t in tickers:
-        price, ts_val, source = db.get_market_last(t)
-        if price is not None:
-            price_rows.append({"ticker": t, "price": price, "ts": ts_val, "source": source or "cache_market_last"})
-            print(f"[SMOKE] price source for {t}: {source or 'cache_market_last'}")
+    for row in db.get_latest_prices(tickers):
+        if row["price"] is not None:
+            price_rows.append(row)
+            print(f"[SMOKE] price source for {row['ticker']}: {row['source']}")
         else:
-            missing_cache.append(t)
+            missing_cache.append(row["ticker"])
 
     if missing_cache:
         print("[yellow]Missing market_last cache[/yellow] for:", ", ".join(missing_cache))
@@ -385,8 +529,7 @@ def smoke(db_path: str = "data/sqlite/tracker.db"):
 
     print(f"[green]Prices ok[/green] rows={len(price_rows)}")
 
-    days_ahead = (4 - datetime.utcnow().weekday()) % 7
-    expiry = (datetime.utcnow() + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
+    expiry = _next_friday()
     chain, chain_ts, chain_source = get_option_chain_snapshot(underlying=tickers[0], expiration=expiry)
     if not chain:
         raise RuntimeError(f"Missing chain snapshot for {tickers[0]} {expiry}")
@@ -456,6 +599,10 @@ def start(
     """Sync universe, stream stocks, run picker, optionally promote, then summary."""
     import time
     from massive_tracker.ws_client import MassiveWSClient
+    from .picker import run_weekly_picker
+    from .promotion import promote_from_weekly_picks
+    from .universe import sync_universe
+    from .summary import write_summary
 
     db = get_db(db_path)
     sync_universe(db)
@@ -467,16 +614,17 @@ def start(
     client.subscribe_stocks(tickers)
     thread = client.run_background()
 
+    watch = tickers[:20]
     deadline = time.time() + max(1, stream_minutes) * 60
     while time.time() < deadline:
-        have = sum(1 for t in tickers[:20] if db.get_market_last(t)[0] is not None)
-        if have >= min(5, len(tickers[:20])):
+        if db.count_market_last_present(watch) >= min(5, len(watch)):
             break
-        time.sleep(5)
+        # Wake on the next cached bar rather than a fixed sleep; re-count at most every 5s.
+        client.bar_cached.wait(timeout=min(5, max(0.0, deadline - time.time())))
+        client.bar_cached.clear()
 
     client.close()
-    if thread.is_alive():
-        time.sleep(1)
+    thread.join(timeout=1)
 
     picks = run_weekly_picker(db_path=db_path, top_n=top_n)
     if promote:
@@ -493,7 +641,10 @@ def monday(
     top_n: int = 10,
 ):
     """Monday run: ensure fresh cache, run picker, promote, write report."""
-    from datetime import datetime, timezone, timedelta
+    from .picker import run_weekly_picker
+    from .promotion import promote_from_weekly_picks
+    from .universe import sync_universe
+    from .report_monday import write_monday_report
 
     print_key_status()
     print("")
@@ -505,19 +656,22 @@ def monday(
         print("[yellow]Universe empty. Run init first.[/yellow]")
         return
 
+    # One market_last query for the whole universe; the cutoff is computed once.
     stale = []
-    now = datetime.now(timezone.utc)
-    for t in tickers:
-        price, ts_val, _source = db.get_market_last(t)
-        if price is None or not ts_val:
-            stale.append(t)
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=20)
+    for row in db.get_latest_prices(tickers):
+        ts_val = row["ts"]
+        if row["price"] is None or not ts_val:
+            stale.append(row["ticker"])
             continue
+        # Cached ts values are isoformat() strings; only a trailing Z needs rewriting.
+        if ts_val.endswith("Z"):
+            ts_val = ts_val[:-1] + "+00:00"
         try:
-            ts_dt = datetime.fromisoformat(str(ts_val).replace("Z", "+00:00"))
-            if now - ts_dt > timedelta(minutes=20):
-                stale.append(t)
+            if datetime.fromisoformat(ts_val) < cutoff:
+                stale.append(row["ticker"])
         except Exception:
-            stale.append(t)
+            stale.append(row["ticker"])
 
     if stale:
         print("[yellow]Stale cache detected[/yellow]. Run the stock stream and retry.")
@@ -533,6 +687,7 @@ def monday(
 @app.command()
 def friday_close(db_path: str = "data/sqlite/tracker.db"):
     """Friday close: compute outcomes and write weekly scorecard."""
+    from .weekly_close import write_weekly_scorecard
     print_key_status()
     print("")
     
@@ -541,9 +696,16 @@ def friday_close(db_path: str = "data/sqlite/tracker.db"):
 
 
 @app.command()
-def chain_fetch(db_path: str = "data/sqlite/tracker.db", expiry: str = "", top_n: int = 0):
-    """Fetch option chain snapshots for enabled tickers and cache to sqlite."""
+def chain_fetch(db_path: str = "data/sqlite/tracker.db", expiry: str = "", top_n: int = 0, concurrency: int = 8):
+    """Fetch option chain snapshots for enabled tickers and cache to sqlite.
+
+    --concurrency sets the worker threads. REST calls still go through
+    massive_client's global rate limit (one call per 15s), so extra workers
+    only overlap the flatfile fallback and cache writes, not the REST waits.
+    """
+    from concurrent.futures import ThreadPoolExecutor
     from massive_tracker.options_chain import get_option_chain
+    from .universe import sync_universe
 
     db = get_db(db_path)
     sync_universe(db)
@@ -551,19 +713,46 @@ def chain_fetch(db_path: str = "data/sqlite/tracker.db", expiry: str = "", top_n
     if top_n:
         tickers = tickers[:top_n]
     if not expiry:
-        from datetime import datetime, timedelta
+        expiry = _next_friday()
 
-        days_ahead = (4 - datetime.utcnow().weekday()) % 7
-        expiry = (datetime.utcnow() + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
+    def _fetch(t):
+        quotes, source = get_option_chain(t, expiry, db_path=db_path, return_source=True, use_cache=False)
+        return t, quotes, source
 
     fetched = 0
-    for t in tickers:
-        quotes, source = get_option_chain(t, expiry, db_path=db_path, return_source=True, use_cache=False)
-        fetched += 1 if quotes else 0
-        print(f"{t} expiry={expiry} chain_source={source} rows={len(quotes)}")
+    # Workers queue on massive_client's REST throttle; only non-REST work runs in parallel.
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for t, quotes, source in pool.map(_fetch, tickers):
+            fetched += 1 if quotes else 0
+            print(f"{t} expiry={expiry} chain_source={source} rows={len(quotes)}")
     print(f"[green]Chain fetch complete[/green]: tickers={len(tickers)} expiry={expiry} cached_rows={fetched}")
 
 
+# Column order for the audit CSVs; rows are built as tuples in exactly this order.
+AUDIT_SOURCE_FIELDS = (
+    "ts", "ticker", "category", "lane", "expiry", "price", "price_source",
+    "bid", "ask", "mid", "prem_source", "strike", "strike_source", "prem_100",
+    "prem_yield", "chain_source", "bars_1m_count", "bars_1m_source",
+    "missing_price", "missing_chain", "used_fallback",
+)
+AUDIT_MATH_FIELDS = (
+    "ticker", "pack_100_cost_calc", "pack_100_cost_reported", "diff_pack",
+    "prem_100_calc", "prem_100_reported", "diff_prem", "prem_yield_calc",
+    "prem_yield_reported", "diff_yield", "pass_fail",
+)
+
+
+def _safe_round(val, nd=2):
+    try:
+        return round(float(val), nd)
+    except Exception:
+        return None
+
+
+def _within(val, tol) -> bool:
+    return val is None or abs(val) <= tol
+
+
 @app.command()
 def audit(
     db_path: str = "data/sqlite/tracker.db",
@@ -571,15 +760,8 @@ def audit(
     top: int = 15,
 ):
     """Audit weekly pick math, provenance, and fallback usage."""
-    from pathlib import Path
     import csv
 
-    REPORT_DIR = Path("data/reports")
-    REPORT_DIR.mkdir(parents=True, exist_ok=True)
-    audit_sources_path = REPORT_DIR / "audit_sources.csv"
-    audit_math_path = REPORT_DIR / "audit_math.csv"
-    audit_md_path = REPORT_DIR / "audit_math.md"
-
     db = get_db(db_path)
     picks = db.fetch_latest_weekly_picks()
     if expiry:
@@ -590,118 +772,121 @@ def audit(
         ]
     if top:
         picks = picks[:top]
+    if not picks:
+        print("[yellow]No picks to audit[/yellow]")
+        return
 
-    def safe_round(val, nd=2):
-        try:
-            return round(float(val), nd)
-        except Exception:
-            return None
+    REPORT_DIR = Path("data/reports")
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    audit_sources_path = REPORT_DIR / "audit_sources.csv"
+    audit_math_path = REPORT_DIR / "audit_math.csv"
+    audit_md_path = REPORT_DIR / "audit_math.md"
 
-    source_rows = []
-    math_rows = []
-    fallback_disabled = True
+    fails = []
     math_failures = 0
     missing_chain = 0
     used_fallback_count = 0
 
-    for p in picks:
-        price = p.get("price")
-        price_source = p.get("price_source") or "missing"
-        chain_mid = p.get("call_mid") if p.get("call_mid") is not None else p.get("chain_mid")
-        prem_reported = p.get("prem_100") if p.get("prem_100") is not None else p.get("est_weekly_prem_100")
-        prem_yield_reported = p.get("prem_yield") if p.get("prem_yield") is not None else p.get("prem_yield_weekly")
-        pack_reported = p.get("pack_100_cost")
-
-        pack_calc = safe_round(float(price) * 100.0, 2) if price is not None else None
-        prem_calc = safe_round(float(chain_mid) * 100.0, 2) if chain_mid is not None else None
-        prem_yield_calc = None
-        if prem_calc is not None and pack_calc not in (None, 0):
-            try:
-                prem_yield_calc = prem_calc / pack_calc
-            except Exception:
-                prem_yield_calc = None
-
-        diff_pack = None if pack_calc is None or pack_reported is None else safe_round(pack_calc - float(pack_reported), 6)
-        diff_prem = None if prem_calc is None or prem_reported is None else safe_round(prem_calc - float(prem_reported), 6)
-        diff_yield = None
-        if prem_yield_calc is not None and prem_yield_reported is not None:
-            try:
-                diff_yield = round(float(prem_yield_calc) - float(prem_yield_reported), 8)
-            except Exception:
-                diff_yield = None
-
-        def within(val, tol):
-            return val is None or abs(val) <= tol
-
-        pass_fail = "PASS" if within(diff_pack, 0.05) and within(diff_prem, 0.05) and within(diff_yield, 1e-4) else "FAIL"
-        if pass_fail == "FAIL":
-            math_failures += 1
-
-        chain_source = p.get("chain_source") or "missing_chain"
-        prem_source = p.get("premium_source") or p.get("prem_source") or "missing_chain"
-        strike_source = p.get("strike_source") or "missing_chain"
-        bars_source = p.get("bars_1m_source") or "missing"
-        missing_chain_flag = 1 if chain_source.startswith("missing") or chain_mid is None else 0
-        missing_chain += missing_chain_flag
-        used_fallback = 0
-        used_fallback_count += used_fallback
-
-        source_rows.append(
-            {
-                "ts": p.get("ts"),
-                "ticker": p.get("ticker"),
-                "category": p.get("category"),
-                "lane": p.get("lane"),
-                "expiry": p.get("expiry") or p.get("recommended_expiry"),
-                "price": price,
-                "price_source": price_source,
-                "bid": p.get("chain_bid"),
-                "ask": p.get("chain_ask"),
-                "mid": chain_mid,
-                "prem_source": prem_source,
-                "strike": p.get("strike") or p.get("recommended_strike"),
-                "strike_source": strike_source,
-                "prem_100": prem_reported,
-                "prem_yield": prem_yield_reported,
-                "chain_source": chain_source,
-                "bars_1m_count": p.get("bars_1m_count"),
-                "bars_1m_source": bars_source,
-                "missing_price": 1 if price is None else 0,
-                "missing_chain": missing_chain_flag,
-                "used_fallback": used_fallback,
-            }
-        )
-
-        math_rows.append(
-            {
-                "ticker": p.get("ticker"),
-                "pack_100_cost_calc": pack_calc,
-                "pack_100_cost_reported": pack_reported,
-                "diff_pack": diff_pack,
-                "prem_100_calc": prem_calc,
-                "prem_100_reported": prem_reported,
-                "diff_prem": diff_prem,
-                "prem_yield_calc": prem_yield_calc,
-                "prem_yield_reported": prem_yield_reported,
-                "diff_yield": diff_yield,
-                "pass_fail": pass_fail,
-            }
-        )
-
-    # Write CSVs
-    with audit_sources_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=list(source_rows[0].keys()) if source_rows else [])
-        if source_rows:
-            writer.writeheader()
-            writer.writerows(source_rows)
+    # Rows are written as they are computed; only the first few failures are kept for the summary.
+    with audit_sources_path.open("w", newline="", encoding="utf-8") as fs, audit_math_path.open(
+        "w", newline="", encoding="utf-8"
+    ) as fm:
+        ws = csv.writer(fs)
+        wm = csv.writer(fm)
+        ws.writerow(AUDIT_SOURCE_FIELDS)
+        wm.writerow(AUDIT_MATH_FIELDS)
+
+        for p in picks:
+            g = p.get
+            price = g("price")
+            price_source = g("price_source") or "missing"
+            chain_mid = g("call_mid")
+            if chain_mid is None:
+                chain_mid = g("chain_mid")
+            prem_reported = g("prem_100")
+            if prem_reported is None:
+                prem_reported = g("est_weekly_prem_100")
+            prem_yield_reported = g("prem_yield")
+            if prem_yield_reported is None:
+                prem_yield_reported = g("prem_yield_weekly")
+            pack_reported = g("pack_100_cost")
+
+            pack_calc = round(float(price) * 100.0, 2) if price is not None else None
+            prem_calc = round(float(chain_mid) * 100.0, 2) if chain_mid is not None else None
+            prem_yield_calc = None
+            if prem_calc is not None and pack_calc not in (None, 0):
+                try:
+                    prem_yield_calc = prem_calc / pack_calc
+                except Exception:
+                    prem_yield_calc = None
+
+            diff_pack = None if pack_calc is None or pack_reported is None else _safe_round(pack_calc - float(pack_reported), 6)
+            diff_prem = None if prem_calc is None or prem_reported is None else _safe_round(prem_calc - float(prem_reported), 6)
+            diff_yield = None
+            if prem_yield_calc is not None and prem_yield_reported is not None:
+                try:
+                    diff_yield = round(float(prem_yield_calc) - float(prem_yield_reported), 8)
+                except Exception:
+                    diff_yield = None
+
+            pass_fail = "PASS" if _within(diff_pack, 0.05) and _within(diff_prem, 0.05) and _within(diff_yield, 1e-4) else "FAIL"
+            if pass_fail == "FAIL":
+                math_failures += 1
+                if len(fails) < 10:
+                    fails.append((g("ticker"), diff_pack, diff_prem, diff_yield))
+
+            chain_source = g("chain_source") or "missing_chain"
+            prem_source = g("premium_source") or g("prem_source") or "missing_chain"
+            strike_source = g("strike_source") or "missing_chain"
+            bars_source = g("bars_1m_source") or "missing"
+            missing_chain_flag = 1 if chain_source.startswith("missing") or chain_mid is None else 0
+            missing_chain += missing_chain_flag
+            used_fallback = 0
+            used_fallback_count += used_fallback
+
+            ws.writerow(
+                (
+                    g("ts"),
+                    g("ticker"),
+                    g("category"),
+                    g("lane"),
+                    g("expiry") or g("recommended_expiry"),
+                    price,
+                    price_source,
+                    g("chain_bid"),
+                    g("chain_ask"),
+                    chain_mid,
+                    prem_source,
+                    g("strike") or g("recommended_strike"),
+                    strike_source,
+                    prem_reported,
+                    prem_yield_reported,
+                    chain_source,
+                    g("bars_1m_count"),
+                    bars_source,
+                    1 if price is None else 0,
+                    missing_chain_flag,
+                    used_fallback,
+                )
+            )
 
-    with audit_math_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=list(math_rows[0].keys()) if math_rows else [])
-        if math_rows:
-            writer.writeheader()
-            writer.writerows(math_rows)
+            wm.writerow(
+                (
+                    g("ticker"),
+                    pack_calc,
+                    pack_reported,
+                    diff_pack,
+                    prem_calc,
+                    prem_reported,
+                    diff_prem,
+                    prem_yield_calc,
+                    prem_yield_reported,
+                    diff_yield,
+                    pass_fail,
+                )
+            )
 
-    total_rows = len(source_rows)
+    total_rows = len(picks)
     md_lines = ["# Audit Math Report", ""]
     md_lines.append(f"Rows checked: {total_rows}")
     md_lines.append(f"Rows using fallback: {used_fallback_count}")
@@ -710,12 +895,11 @@ def audit(
     md_lines.append("")
 
     # Top failures
-    fails = [r for r in math_rows if r.get("pass_fail") == "FAIL"]
     if fails:
         md_lines.append("## Top Math Failures")
-        for r in fails[:10]:
+        for ticker, diff_pack, diff_prem, diff_yield in fails:
             md_lines.append(
-                f"- {r['ticker']}: diff_pack={r.get('diff_pack')} diff_prem={r.get('diff_prem')} diff_yield={r.get('diff_yield')}"
+                f"- {ticker}: diff_pack={diff_pack} diff_prem={diff_prem} diff_yield={diff_yield}"
             )
     else:
         md_lines.append("No math failures detected.")
@@ -731,6 +915,7 @@ def oced(
     lookback_days: int = 365,
 ):
     """Run OCED scan (weekly-style signals) and store results in sqlite."""
+    from .oced import run_oced_scan
     rows = run_oced_scan(db_path=db_path, lookback_days=lookback_days)
     print(f"[green]OCED scan complete[/green] -> oced_scores ({len(rows)} rows)")
 
@@ -743,6 +928,7 @@ def promote(
     top_n: int = 3,
 ):
     """Promote latest weekly_picks into option_positions with gates."""
+    from .promotion import promote_from_weekly_picks
     results = promote_from_weekly_picks(db_path=db_path, seed=seed, lane=lane, top_n=top_n)
     promoted = [r for r in results if not r.skipped]
     skipped = [r for r in results if r.skipped]
@@ -772,12 +958,12 @@ def stream(
         python -m massive_tracker.cli stream
         python -m massive_tracker.cli stream --tickers AAPL,MSFT
     """
-    from .ws_client import MassiveWSClient, make_monitor_bar_handler
+    from .ws_client import BufferedBarPrinter, MassiveWSClient, make_monitor_bar_handler
     from .watchlist import Watchlists
     
     # Get symbols to watch
     if tickers:
-        symbols = [t.strip().upper() for t in tickers.split(",")]
+        symbols = _split_csv(tickers)
     else:
         # Use watchlist from DB
         wl = Watchlists(get_db(db_path))
@@ -790,6 +976,7 @@ def stream(
     print(f"[green]Streaming real-time data for:[/green] {', '.join(symbols)}")
     print("[dim]Press Ctrl+C to stop[/dim]\n")
     
+    printer = None
     if monitor_triggers:
         handler = make_monitor_bar_handler(
             db_path=db_path,
@@ -798,24 +985,20 @@ def stream(
             cooldown_sec=cooldown_sec,
         )
         client = MassiveWSClient(
-            api_key=_cfg().massive_api_key,
+            api_key=CFG.massive_api_key,
             market_cache_db_path=db_path if cache_market_last else None,
         )
         client.on_aggregate_minute = handler
         client.subscribe_stocks(symbols)
         print("[green]Trigger mode:[/green] monitor runs on near-strike or rapid-up events")
     else:
-        def on_bar(event):
-            sym = event.get("sym")
-            close = event.get("c")
-            vol = event.get("v")
-            print(f"📊 {sym}: ${close:.2f} vol={vol:,}")
+        printer = BufferedBarPrinter()
 
         client = MassiveWSClient(
-            api_key=_cfg().massive_api_key,
+            api_key=CFG.massive_api_key,
             market_cache_db_path=db_path if cache_market_last else None,
         )
-        client.on_aggregate_minute = on_bar
+        client.on_aggregate_minute = printer
         client.subscribe_stocks(symbols)
     
     try:
@@ -823,6 +1006,9 @@ def stream(
     except KeyboardInterrupt:
         print("\n[green]Stopped streaming[/green]")
         client.close()
+    finally:
+        if printer is not None:
+            printer.close()
 
 
 def _utc_now() -> str:
@@ -840,34 +1026,38 @@ def propose_universe_candidates(
     Propose new universe tickers from curated data (JSON list) or fallback to OCED constants.
     Stores into universe_candidates for later approval.
     """
-    import json
+    try:
+        from orjson import loads as json_loads  # optional; parses bytes directly
+    except ImportError:
+        from json import loads as json_loads
     from .oced import TICKERS as OCED_TICKERS
 
     db = get_db(db_path)
     wl = Watchlists(db)
 
-    candidates: list[str] = []
+    # Normalized and deduplicated in one pass.
+    candidates: set[str] = set()
     path = Path(source_file)
     if path.exists():
         try:
-            data = json.loads(path.read_text())
+            data = json_loads(path.read_bytes())
             if isinstance(data, list):
-                candidates = [str(t).upper().strip() for t in data if str(t).strip()]
+                candidates = {t for t in (str(raw).strip().upper() for raw in data) if t}
         except Exception:
-            candidates = []
+            candidates = set()
     if not candidates:
-        candidates = [t.upper() for t in OCED_TICKERS]
+        candidates = {t.upper() for t in OCED_TICKERS}
 
-    existing = set(wl.list_tickers())
     ts = _utc_now()
-    new_items = [t for t in candidates if t and t not in existing]
-
-    with db.connect() as con:
-        for t in new_items:
-            con.execute(
-                "INSERT OR REPLACE INTO universe_candidates(ts, ticker, reason, source, score, approved) VALUES(?, ?, ?, ?, ?, 0)",
-                (ts, t, reason, source, None),
-            )
+    with db.session() as con:
+        existing = set(wl.list_tickers(con=con))
+        # Sorted keeps PK inserts sequential.
+        new_items = sorted(candidates - existing)
+        con.executemany(
+            "INSERT INTO universe_candidates(ts, ticker, reason, source, score, approved) VALUES(?, ?, ?, ?, ?, 0) "
+            "ON CONFLICT(ts, ticker) DO NOTHING",
+            [(ts, t, reason, source, None) for t in new_items],
+        )
     print(f"[green]Queued[/green] {len(new_items)} candidates from {source}")
 
 
@@ -883,28 +1073,22 @@ def approve_universe_candidates(
     db = get_db(db_path)
     wl = Watchlists(db)
 
-    selected: list[str] = []
-    with db.connect() as con:
-        if tickers:
-            selected = [t.strip().upper() for t in tickers.split(",") if t.strip()]
-            if selected:
-                rows = con.execute(
-                    "SELECT ticker FROM universe_candidates WHERE approved=0 AND ticker IN (%s)" % ",".join("?" * len(selected)),
-                    selected,
-                ).fetchall()
-                selected = [r[0] for r in rows]
+    requested = _split_csv(tickers)
+    approve_sql = "UPDATE universe_candidates SET approved=1 WHERE approved=0"
+    with db.session() as con:
+        if requested:
+            # Stage the requested set; RETURNING reports which of them were actually pending.
+            con.execute("CREATE TEMP TABLE IF NOT EXISTS _pending(ticker TEXT PRIMARY KEY)")
+            con.execute("DELETE FROM _pending")
+            con.executemany("INSERT OR IGNORE INTO _pending(ticker) VALUES(?)", [(t,) for t in requested])
+            rows = con.execute(approve_sql + " AND ticker IN (SELECT ticker FROM _pending) RETURNING ticker").fetchall()
+            con.execute("DELETE FROM _pending")
+        elif not tickers:
+            rows = con.execute(approve_sql + " RETURNING ticker").fetchall()
         else:
-            rows = con.execute(
-                "SELECT ticker FROM universe_candidates WHERE approved=0"
-            ).fetchall()
-            selected = [r[0] for r in rows]
-
-        for t in selected:
-            wl.add_ticker(t)
-            con.execute(
-                "UPDATE universe_candidates SET approved=1 WHERE ticker=?",
-                (t,),
-            )
+            rows = []
+        selected = list(dict.fromkeys(r[0] for r in rows))
+        wl.add_tickers(selected, con=con)
     print(f"[green]Approved[/green] {len(selected)} candidates -> tickers table")
 
 
@@ -915,6 +1099,7 @@ def run(db_path: str = "data/sqlite/tracker.db", date: str = ""):
     Uses saved defaults from data/config/run_profile.json
     If date not supplied, defaults to yesterday.
     """
+    from .run import run_once
     run_once(db_path=db_path, date=date or None)
 
 @app.command()
@@ -929,6 +1114,7 @@ def sync_flatfiles(
     Downloads 1-minute aggregates from Massive API for all active tickers.
     Updates existing files with recent data and removes inactive tickers.
     """
+    from .flatfile_manager import FlatfileManager
     print(f"[FLATFILE SYNC] Syncing flat files: days_back={days_back}, update={update_existing}")
     
     mgr = FlatfileManager(db_path=db_path)
@@ -947,6 +1133,14 @@ def sync_flatfiles(
     print(f"\n[BAR COUNTS]")
     for ticker, info in stats['bar_counts'].items():
         print(f"  {ticker}: {info['bars']} bars ({info['first_date']} to {info['last_date']})")
+@app.command()
+def migrate_flatfile_csv(db_path: str = "data/sqlite/tracker.db"):
+    """Convert legacy {ticker}.csv flat files to the Parquet layout (deletes the CSVs)."""
+    from .flatfile_manager import FlatfileManager
+    migrated = FlatfileManager(db_path=db_path).migrate_csv_files()
+    print(f"[green]Migrated[/green] {migrated} CSV flat files to Parquet")
+
+
 if __name__ == "__main__":
     app()
 
@@ -1,34 +1,41 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import List, Dict
 
 from .store import get_db
-from .summary import MODEL_COMPARE_PATH
+from .summary import MODEL_COMPARE_PATH, write_json_report
 
 
-def _promote_variant(picks: list[dict], *, seed: float, top_n: int, mode: str) -> Dict[str, dict]:
-    # mode: baseline, gated, weighted
+def _rank_picks(picks: list[dict], top_n: int) -> list[tuple]:
+    """Ranked slice as (ticker, price, pack_cost, strike, expiry, bars, unstable, score) tuples."""
     picks_sorted = sorted(
         picks,
         key=lambda p: (p.get("rank") or 9999, -(p.get("final_rank_score") or p.get("score") or 0.0)),
     )
     if top_n:
         picks_sorted = picks_sorted[:top_n]
+    # Field reads and status lowercasing happen once here, not once per variant.
+    return [
+        (
+            p.get("ticker") or "",
+            p.get("price"),
+            p.get("pack_100_cost"),
+            p.get("recommended_strike"),
+            p.get("recommended_expiry"),
+            p.get("bars_1m_count") or 0,
+            "unstable" in (p.get("fft_status") or "").lower() or "unstable" in (p.get("fractal_status") or "").lower(),
+            p.get("final_rank_score") or p.get("score") or 0.0,
+        )
+        for p in picks_sorted
+    ]
 
+
+def _promote_variant(ranked: list[tuple], *, seed: float, mode: str) -> Dict[str, dict]:
+    # mode: baseline, gated, weighted; ranked comes from _rank_picks
     remaining = float(seed)
     decisions: Dict[str, dict] = {}
-    for p in picks_sorted:
-        ticker = p.get("ticker") or ""
-        price = p.get("price")
-        pack_cost = p.get("pack_100_cost")
-        strike = p.get("recommended_strike")
-        expiry = p.get("recommended_expiry")
-        bars = p.get("bars_1m_count") or 0
-        fft_status = (p.get("fft_status") or "").lower()
-        frac_status = (p.get("fractal_status") or "").lower()
-
+    for ticker, price, pack_cost, strike, expiry, bars, unstable, score in ranked:
         if price is None or pack_cost is None:
             decision = "skip_missing"
         elif pack_cost > remaining:
@@ -39,15 +46,14 @@ def _promote_variant(picks: list[dict], *, seed: float, top_n: int, mode: str) -
             if mode == "gated":
                 if bars < 120:
                     decision = "skip_bars"
-                elif "unstable" in fft_status or "unstable" in frac_status:
+                elif unstable:
                     decision = "skip_structure"
             elif mode == "weighted":
                 if bars < 120:
                     decision = "skip_bars"
                 else:
                     # penalize low structure by reducing effective score
-                    score = p.get("final_rank_score") or p.get("score") or 0.0
-                    penalty = 0.2 if ("unstable" in fft_status or "unstable" in frac_status) else 0.0
+                    penalty = 0.2 if unstable else 0.0
                     score_adj = score - penalty
                     if score_adj < 0:
                         decision = "skip_structure"
@@ -63,10 +69,11 @@ def _promote_variant(picks: list[dict], *, seed: float, top_n: int, mode: str) -
 
 def run_compare(db_path: str = "data/sqlite/tracker.db", seed: float = 9300.0, top_n: int = 10) -> dict:
     db = get_db(db_path)
-    picks = db.fetch_latest_weekly_picks()
-    baseline = _promote_variant(picks, seed=seed, top_n=top_n, mode="baseline")
-    gated = _promote_variant(picks, seed=seed, top_n=top_n, mode="gated")
-    weighted = _promote_variant(picks, seed=seed, top_n=top_n, mode="weighted")
+    # Every variant walks the same ranked slice, so sort it once.
+    ranked = _rank_picks(db.fetch_latest_weekly_picks(), top_n)
+    baseline = _promote_variant(ranked, seed=seed, mode="baseline")
+    gated = _promote_variant(ranked, seed=seed, mode="gated")
+    weighted = _promote_variant(ranked, seed=seed, mode="weighted")
 
     decision_changes: List[str] = []
     strike_changes: List[str] = []
@@ -91,8 +98,7 @@ def run_compare(db_path: str = "data/sqlite/tracker.db", seed: float = 9300.0, t
         "weighted": weighted,
     }
 
-    MODEL_COMPARE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    MODEL_COMPARE_PATH.write_text(json.dumps(out, indent=2))
+    write_json_report(MODEL_COMPARE_PATH, out)
     return out
 
 
@@ -2,20 +2,28 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
 
-# Optional: Bootstrap from GCP Secret Manager if GCP_PROJECT_ID is set
-if os.getenv("GCP_PROJECT_ID"):
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Populate os.environ from .env (and GCP, if configured) once per process."""
     try:
-        from .secrets import bootstrap_env_from_gcp
-        bootstrap_env_from_gcp()
+        from dotenv import load_dotenv
+        load_dotenv()
     except ImportError:
-        pass  # google-cloud-secret-manager not installed
+        pass
+
+    # Optional: Bootstrap from GCP Secret Manager if GCP_PROJECT_ID is set
+    if os.getenv("GCP_PROJECT_ID"):
+        try:
+            from .secrets import bootstrap_env_from_gcp
+            bootstrap_env_from_gcp()
+        except ImportError:
+            pass  # google-cloud-secret-manager not installed
+
+
+_load_env()
 
 
 @dataclass(frozen=True)
@@ -72,6 +80,7 @@ def print_key_status():
 
 
 def load_runtime_config() -> RuntimeConfig:
+    _load_env()
     key = os.getenv("MASSIVE_ACCESS_KEY") or os.getenv("MASSIVE_API_KEY")
     if not key:
         # For testing environments, allow missing key with a warning
@@ -81,7 +90,8 @@ def load_runtime_config() -> RuntimeConfig:
             raise RuntimeError("Missing MASSIVE_ACCESS_KEY or MASSIVE_API_KEY in environment/Codespaces secrets")
     key_id = os.getenv("MASSIVE_KEY_ID")
 
-    if os.getenv("VFL_DEBUG_CONFIG", "").strip().lower() in {"1", "true", "yes"}:
+    debug = os.getenv("VFL_DEBUG_CONFIG", "")
+    if debug.strip().lower() in {"1", "true", "yes"}:
         print(
             "Runtime env presence: "
             f"MASSIVE_ACCESS_KEY={bool(os.getenv('MASSIVE_ACCESS_KEY'))} "
@@ -90,7 +100,7 @@ def load_runtime_config() -> RuntimeConfig:
             f"MASSIVE_S3_ENDPOINT={bool(os.getenv('MASSIVE_S3_ENDPOINT'))} "
             f"MASSIVE_S3_BUCKET={bool(os.getenv('MASSIVE_S3_BUCKET'))}"
         )
-    if os.getenv("VFL_DEBUG_CONFIG") == "1":
+    if debug == "1":
         debug_keys = (
             "MASSIVE_ACCESS_KEY",
             "MASSIVE_KEY_ID",
@@ -127,6 +137,7 @@ def load_flatfile_config(*, required: bool = True) -> FlatfileConfig | None:
     
     Falls back to AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY for compatibility.
     """
+    _load_env()
 
     access_key = _first_env("MASSIVE_KEY_ID", "AWS_ACCESS_KEY_ID", "M_S3_ACCESS_KEY_ID")
     secret_key = _first_env("MASSIVE_SECRET_KEY", "AWS_SECRET_ACCESS_KEY", "M_S3_SECRET_ACCESS_KEY")
@@ -138,18 +149,42 @@ def load_flatfile_config(*, required: bool = True) -> FlatfileConfig | None:
             )
         return None
 
-    return FlatfileConfig(
-        access_key=access_key,
-        secret_key=secret_key,
-        endpoint=os.getenv("MASSIVE_S3_ENDPOINT", "https://files.massive.com"),
-        bucket=os.getenv("MASSIVE_S3_BUCKET", "flatfiles"),
-        stocks_prefix=os.getenv("MASSIVE_STOCKS_PREFIX", "us_stocks_sip"),
-        options_prefix=os.getenv("MASSIVE_OPTIONS_PREFIX", "us_options_opra"),
+    return _flatfile_config(
+        access_key,
+        secret_key,
+        os.getenv("MASSIVE_S3_ENDPOINT", "https://files.massive.com"),
+        os.getenv("MASSIVE_S3_BUCKET", "flatfiles"),
+        os.getenv("MASSIVE_STOCKS_PREFIX", "us_stocks_sip"),
+        os.getenv("MASSIVE_OPTIONS_PREFIX", "us_options_opra"),
     )
 
 
-# Runtime singleton
-CFG = load_runtime_config()
+@lru_cache(maxsize=4)
+def _flatfile_config(*values: str) -> FlatfileConfig:
+    """Keyed on the resolved env values, so repeat callers share one object until the env changes."""
+    return FlatfileConfig(*values)
+
+
+@lru_cache(maxsize=1)
+def get_cfg() -> RuntimeConfig:
+    """Runtime config, read from the environment on first use and cached for the process."""
+    return load_runtime_config()
+
+
+class _LazyConfig:
+    """Stand-in for CFG that defers get_cfg() (and its missing-key error) to first attribute access."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        return getattr(get_cfg(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_cfg())
+
+
+# Runtime singleton; importing it is free, the env is read on first attribute access.
+CFG: RuntimeConfig = _LazyConfig()  # type: ignore[assignment]
 
 # Backwards alias until callers are updated
 MassiveConfig = FlatfileConfig
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
-import json
 
 from .massive_client import get_option_chain_snapshot
 from .store import get_db
@@ -45,6 +46,10 @@ def load_spot_map(db_path: str, tickers: Iterable[str]) -> Dict[str, float]:
     return out
 
 
+def _score(row: Dict) -> float:
+    return row.get("score") or 0.0
+
+
 def rank_covered_calls(
     tickers: Iterable[str],
     expirations: Iterable[str],
@@ -65,98 +70,102 @@ def rank_covered_calls(
     spot_map = spot_map or {}
     today = _today()
 
+    jobs = [(ticker.upper().strip(), exp) for ticker in tickers for exp in expiries]
+    # Per-row invariants: days to expiry depends only on the expiry.
+    dte_by_exp: Dict[str, int] = {}
+    for exp in expiries:
+        try:
+            dte_by_exp[exp] = max(1, (datetime.fromisoformat(exp).date() - today).days)
+        except Exception:
+            dte_by_exp[exp] = 7
+    delta_lo, delta_hi = delta_band
     all_rows: List[Dict] = []
 
-    for ticker in tickers:
-        tkr = ticker.upper().strip()
+    # Sequential: each snapshot waits on massive_client's 15s REST throttle, so threads gain nothing.
+    for tkr, exp in jobs:
+        try:
+            chain, ts, _source = get_option_chain_snapshot(tkr, exp)
+        except Exception:
+            continue
+        if not chain:
+            continue
         spot = spot_map.get(tkr)
-        for exp in expiries:
-            try:
-                chain, ts, source = get_option_chain_snapshot(tkr, exp)
-            except Exception:
+        dte = dte_by_exp[exp]
+
+        for row in chain:
+            mid = row.get("mid")
+            bid = row.get("bid")
+            ask = row.get("ask")
+            strike = row.get("strike")
+            delta = row.get("delta")
+            iv = row.get("iv")
+            oi = row.get("oi") or row.get("open_interest")
+            vol = row.get("vol") or row.get("volume")
+
+            if mid is None:
                 continue
-            if not chain:
+            if bid is not None and ask is not None and bid > ask:
                 continue
-
-            for row in chain:
-                mid = row.get("mid")
-                bid = row.get("bid")
-                ask = row.get("ask")
-                strike = row.get("strike")
-                delta = row.get("delta")
-                iv = row.get("iv")
-                oi = row.get("oi") or row.get("open_interest")
-                vol = row.get("vol") or row.get("volume")
-
-                if mid is None:
-                    continue
-                if bid is not None and ask is not None and bid > ask:
-                    continue
-                spread_pct = None
-                if bid is not None and ask is not None and mid:
-                    try:
-                        spread_pct = max(0.0, (ask - bid) / mid)
-                    except Exception:
-                        spread_pct = None
-                if spread_pct is not None and spread_pct > max_spread_pct:
-                    continue
-                if oi is not None:
-                    try:
-                        if int(oi) < min_oi:
-                            continue
-                    except Exception:
-                        pass
-                if delta is not None:
-                    try:
-                        d = float(delta)
-                        if d < delta_band[0] or d > delta_band[1]:
-                            continue
-                    except Exception:
-                        pass
-
-                # Yield and scoring
-                yield_den = spot if spot else strike or 1.0
+            spread_pct = None
+            if bid is not None and ask is not None and mid:
+                try:
+                    spread_pct = max(0.0, (ask - bid) / mid)
+                except Exception:
+                    spread_pct = None
+            if spread_pct is not None and spread_pct > max_spread_pct:
+                continue
+            if oi is not None:
                 try:
-                    prem_yield = float(mid) / float(yield_den)
+                    if int(oi) < min_oi:
+                        continue
                 except Exception:
-                    prem_yield = None
+                    pass
+            if delta is not None:
                 try:
-                    exp_dt = datetime.fromisoformat(exp).date()
-                    dte = max(1, (exp_dt - today).days)
+                    d = float(delta)
+                    if d < delta_lo or d > delta_hi:
+                        continue
                 except Exception:
-                    exp_dt = None
-                    dte = 7
-                score = prem_yield / dte if prem_yield is not None else 0.0
-
-                all_rows.append(
-                    {
-                        "ticker": tkr,
-                        "expiry": exp,
-                        "strike": strike,
-                        "mid": mid,
-                        "bid": bid,
-                        "ask": ask,
-                        "delta": delta,
-                        "iv": iv,
-                        "oi": oi,
-                        "vol": vol,
-                        "spread_pct": spread_pct,
-                        "spot_used": spot,
-                        "prem_yield": prem_yield,
-                        "dte": dte,
-                        "score": score,
-                        "ts": ts,
-                    }
-                )
-
-    # Top per ticker
+                    pass
+
+            # Yield and scoring
+            yield_den = spot if spot else strike or 1.0
+            try:
+                prem_yield = float(mid) / float(yield_den)
+            except Exception:
+                prem_yield = None
+            score = prem_yield / dte if prem_yield is not None else 0.0
+
+            all_rows.append(
+                {
+                    "ticker": tkr,
+                    "expiry": exp,
+                    "strike": strike,
+                    "mid": mid,
+                    "bid": bid,
+                    "ask": ask,
+                    "delta": delta,
+                    "iv": iv,
+                    "oi": oi,
+                    "vol": vol,
+                    "spread_pct": spread_pct,
+                    "spot_used": spot,
+                    "prem_yield": prem_yield,
+                    "dte": dte,
+                    "score": score,
+                    "ts": ts,
+                }
+            )
+
+    # Top per ticker: one grouping pass, then a bounded heap per group.
+    by_ticker: Dict[str, List[Dict]] = defaultdict(list)
+    for r in all_rows:
+        by_ticker[r["ticker"]].append(r)
     ranked: List[Dict] = []
-    for tkr in {r["ticker"] for r in all_rows}:
-        subset = [r for r in all_rows if r["ticker"] == tkr]
-        subset.sort(key=lambda r: r.get("score") or 0.0, reverse=True)
-        ranked.extend(subset[:top_n_per_ticker])
+    for subset in by_ticker.values():
+        ranked.extend(heapq.nlargest(top_n_per_ticker, subset, key=_score))
 
-    ranked.sort(key=lambda r: r.get("score") or 0.0, reverse=True)
+    ranked.sort(key=_score, reverse=True)
 
     return {
         "generated": datetime.now(timezone.utc).isoformat(),
@@ -166,6 +175,6 @@ def rank_covered_calls(
 
 
 def save_results(payload: Dict, path: Path = COVERED_CALLS_PATH) -> Path:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2))
-    return path
+    from .summary import write_json_report
+
+    return write_json_report(path, payload)
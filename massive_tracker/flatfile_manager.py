@@ -8,14 +8,17 @@ This module handles:
 """
 from __future__ import annotations
 
-import csv
 import logging
-import time
+import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .flatfiles import _duck
 from .massive_client import get_aggs_df
 from .store import get_db
 from .watchlist import Watchlists
@@ -24,6 +27,29 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_FLATFILE_DIR = Path("data/flatfiles/stocks_1m")
 DAYS_LOOKBACK = 60  # Download 60 days of history for FFT/Fractal analysis
+BAR_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+ROW_GROUP_ROWS = 128_000
+
+
+def ticker_glob(ticker: str, flatfile_dir: Path | str = DEFAULT_FLATFILE_DIR) -> Optional[str]:
+    """Parquet glob for one ticker's bars (ticker=XXX/date=YYYY-MM/part.parquet), or None if absent."""
+    tdir = Path(flatfile_dir) / f"ticker={ticker.upper()}"
+    if not tdir.is_dir():
+        return None
+    return f"{tdir.as_posix()}/*/*.parquet"
+
+
+def _utc(ts) -> Optional[datetime]:
+    """Bars are stored as naive UTC; hand them back tz-aware."""
+    if ts is None:
+        return None
+    return pd.Timestamp(ts).tz_localize(timezone.utc).to_pydatetime()
+
+
+def _normalize_bars(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[BAR_COLUMNS].copy()
+    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True).dt.tz_convert(None)
+    return df.drop_duplicates(subset=['timestamp'], keep='last').sort_values('timestamp')
 
 
 class FlatfileManager:
@@ -42,34 +68,58 @@ class FlatfileManager:
 
     def get_active_tickers(self) -> List[str]:
         """Get list of enabled tickers from universe."""
-        with self.db.connect() as con:
+        with self.db.session() as con:
             rows = con.execute(
                 "SELECT ticker FROM universe WHERE enabled=1 ORDER BY ticker"
             ).fetchall()
         return [r[0] for r in rows]
 
+    def _ticker_dir(self, ticker: str) -> Path:
+        return self.flatfile_dir / f"ticker={ticker.upper()}"
+
+    def migrate_csv_files(self) -> int:
+        """One-time conversion of the legacy {ticker}.csv layout to Parquet.
+
+        Converted CSVs are deleted, so this only runs when asked for
+        (``cli migrate_flatfile_csv``), never on construction. Returns files migrated.
+        """
+        migrated = 0
+        for csv_path in self.flatfile_dir.glob("*.csv"):
+            try:
+                df = pd.read_csv(csv_path)
+                if df.empty or not set(BAR_COLUMNS) <= set(df.columns):
+                    continue
+                self.append_to_flatfile(csv_path.stem, df, mode='overwrite')
+                csv_path.unlink()
+                migrated += 1
+                logger.info(f"Migrated {csv_path.name} to Parquet")
+            except Exception as e:
+                logger.error(f"Error migrating {csv_path.name}: {e}")
+        return migrated
+
     def get_existing_tickers(self) -> List[str]:
         """Get list of tickers that already have flat files."""
-        csv_files = list(self.flatfile_dir.glob("*.csv"))
-        return sorted([f.stem for f in csv_files])
-
-    def get_file_date_range(self, ticker: str) -> tuple[Optional[datetime], Optional[datetime]]:
-        """Get earliest and latest timestamps in a ticker's flat file."""
-        csv_path = self.flatfile_dir / f"{ticker}.csv"
-        if not csv_path.exists():
-            return None, None
+        return sorted(d.name.split("=", 1)[1] for d in self.flatfile_dir.glob("ticker=*") if d.is_dir())
 
+    def get_bar_stats(self, ticker: str) -> tuple[int, Optional[datetime], Optional[datetime]]:
+        """Bar count and first/last UTC timestamps; answered from Parquet column statistics."""
+        pattern = ticker_glob(ticker, self.flatfile_dir)
+        if pattern is None:
+            return 0, None, None
         try:
-            df = pd.read_csv(csv_path)
-            if df.empty or 'timestamp' not in df.columns:
-                return None, None
-            
-            # Convert timestamp column to datetime (and ensure UTC)
-            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
-            return df['timestamp'].min(), df['timestamp'].max()
+            with _duck() as con:
+                n, first, last = con.execute(
+                    "SELECT count(*), min(timestamp), max(timestamp) FROM read_parquet(?)", [pattern]
+                ).fetchone()
+            return int(n), _utc(first), _utc(last)
         except Exception as e:
-            logger.error(f"Error reading {ticker}.csv: {e}")
-            return None, None
+            logger.error(f"Error reading {ticker} flat files: {e}")
+            return 0, None, None
+
+    def get_file_date_range(self, ticker: str) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Get earliest and latest timestamps in a ticker's flat file."""
+        _, first, last = self.get_bar_stats(ticker)
+        return first, last
 
     def download_history(
         self,
@@ -122,34 +172,43 @@ class FlatfileManager:
     def append_to_flatfile(self, ticker: str, df: pd.DataFrame, mode: str = 'append'):
         """Append or overwrite data to ticker's flat file.
         
+        Bars are stored as ticker=XXX/date=YYYY-MM/part.parquet (ZSTD), so an
+        append only rewrites the months it touches.
+        
         Args:
             ticker: Stock symbol
             df: DataFrame with OHLCV data
             mode: 'append' to add new data, 'overwrite' to replace file
         """
-        csv_path = self.flatfile_dir / f"{ticker}.csv"
+        tdir = self._ticker_dir(ticker)
         
         if df.empty:
             logger.warning(f"No data to write for {ticker}")
             return
         
-        # Remove duplicates and sort by timestamp
-        df = df.drop_duplicates(subset=['timestamp']).sort_values('timestamp')
+        df = _normalize_bars(df)
+        if mode != 'append' and tdir.exists():
+            shutil.rmtree(tdir)
         
-        if mode == 'append' and csv_path.exists():
-            # Load existing data
-            existing_df = pd.read_csv(csv_path)
-            existing_df['timestamp'] = pd.to_datetime(existing_df['timestamp'], utc=True)
-            
-            # Combine and deduplicate
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            combined_df = combined_df.drop_duplicates(subset=['timestamp']).sort_values('timestamp')
-            
-            logger.info(f"Appending to {ticker}.csv: {len(df)} new bars, {len(combined_df)} total")
-            combined_df.to_csv(csv_path, index=False)
-        else:
-            logger.info(f"Writing {ticker}.csv: {len(df)} bars")
-            df.to_csv(csv_path, index=False)
+        total = 0
+        for month, part in df.groupby(df['timestamp'].dt.strftime('%Y-%m'), sort=True):
+            part_path = tdir / f"date={month}" / "part.parquet"
+            try:
+                existing = pq.read_table(part_path, columns=BAR_COLUMNS).to_pandas()
+            except FileNotFoundError:
+                part_path.parent.mkdir(parents=True, exist_ok=True)
+            else:
+                # New bars win over stored ones for the same minute
+                part = pd.concat([existing, part], ignore_index=True)
+                part = part.drop_duplicates(subset=['timestamp'], keep='last').sort_values('timestamp')
+            pq.write_table(
+                pa.Table.from_pandas(part, preserve_index=False),
+                part_path,
+                compression='zstd',
+                row_group_size=ROW_GROUP_ROWS,
+            )
+            total += len(part)
+        logger.info(f"Wrote {ticker} flat files ({mode}): {len(df)} bars across touched months, {total} stored")
 
     def sync_universe(
         self,
@@ -205,7 +264,7 @@ class FlatfileManager:
                 
                 if last_date is None:
                     # File exists but empty/corrupted, re-download
-                    logger.warning(f"{ticker}.csv is empty/corrupted, re-downloading")
+                    logger.warning(f"{ticker} flat files are empty/corrupted, re-downloading")
                     end_date = datetime.now(timezone.utc)
                     start_date = end_date - timedelta(days=days_back)
                     df = self.download_history(ticker, start_date, end_date)
@@ -227,25 +286,16 @@ class FlatfileManager:
         if tickers_to_remove:
             logger.info(f"Removing {len(tickers_to_remove)} inactive tickers: {sorted(tickers_to_remove)}")
             for ticker in tickers_to_remove:
-                csv_path = self.flatfile_dir / f"{ticker}.csv"
-                if csv_path.exists():
-                    csv_path.unlink()
-                    logger.info(f"Deleted {ticker}.csv")
+                tdir = self._ticker_dir(ticker)
+                if tdir.exists():
+                    shutil.rmtree(tdir)
+                    logger.info(f"Deleted {tdir.name}")
         
         logger.info("Flat file sync complete")
 
     def get_bar_count(self, ticker: str) -> int:
         """Get number of bars in ticker's flat file."""
-        csv_path = self.flatfile_dir / f"{ticker}.csv"
-        if not csv_path.exists():
-            return 0
-        
-        try:
-            df = pd.read_csv(csv_path)
-            return len(df)
-        except Exception as e:
-            logger.error(f"Error reading {ticker}.csv: {e}")
-            return 0
+        return self.get_bar_stats(ticker)[0]
 
     def get_summary(self) -> dict:
         """Get summary statistics of flat files."""
@@ -261,8 +311,7 @@ class FlatfileManager:
         }
         
         for ticker in existing_tickers:
-            bar_count = self.get_bar_count(ticker)
-            first_date, last_date = self.get_file_date_range(ticker)
+            bar_count, first_date, last_date = self.get_bar_stats(ticker)
             stats['bar_counts'][ticker] = {
                 'bars': bar_count,
                 'first_date': first_date.isoformat() if first_date else None,
@@ -1,20 +1,68 @@
 from __future__ import annotations
 
 import datetime as dt
+import math
 import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import boto3
+import duckdb
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from botocore.config import Config as BotoConfig
 
 from .config import FlatfileConfig, load_flatfile_config
 from .store import get_db
-from .s3_flatfiles import MassiveS3
+from .s3_flatfiles import MassiveS3, get_s3
 
 DEFAULT_ENDPOINT = os.getenv("MASSIVE_S3_ENDPOINT", "https://files.massive.com")
 DEFAULT_BUCKET = os.getenv("MASSIVE_S3_BUCKET", "flatfiles")
+# Hive layout (ticker=XXX/dt=YYYY-MM-DD) so per-ticker reads only open that ticker's files.
+STOCK_DAY_PARQUET_DIR = Path("data/parquet/stocks_day_agg")
+# Massive SIP aggregates layout; files with exactly these headers skip DuckDB's type sniffing.
+STOCK_AGGS_SCHEMA = {
+    "ticker": "VARCHAR",
+    "volume": "BIGINT",
+    "open": "DOUBLE",
+    "close": "DOUBLE",
+    "high": "DOUBLE",
+    "low": "DOUBLE",
+    "window_start": "BIGINT",
+    "transactions": "BIGINT",
+}
+# Enabled-universe snapshot; lets repeated ingests filter without re-querying sqlite.
+UNIVERSE_PARQUET = Path("data/parquet/universe.parquet")
+# Rows decoded per batch when streaming a flatfile into sqlite (bounds peak RSS).
+CHUNK_ROWS = 200_000
+DUCKDB_THREADS = int(os.getenv("DUCKDB_THREADS", "8"))
+DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", "8GB")
+
+_DUCK: duckdb.DuckDBPyConnection | None = None
+_DUCK_LOCK = threading.Lock()
+
+
+def _duck() -> duckdb.DuckDBPyConnection:
+    """
+    Return a fresh cursor on the process-wide in-memory DuckDB database.
+
+    The database (thread pool, memory limit, object cache, loaded extensions) is
+    created once and stays warm across ingests. Each cursor is its own session,
+    so registered views and temp tables never leak between callers or threads.
+    """
+    global _DUCK
+    with _DUCK_LOCK:
+        if _DUCK is None:
+            con = duckdb.connect(":memory:")
+            con.execute(f"PRAGMA threads={DUCKDB_THREADS}")
+            con.execute("PRAGMA memory_limit=?", [DUCKDB_MEMORY_LIMIT])
+            con.execute("PRAGMA enable_object_cache")
+            _DUCK = con
+        return _DUCK.cursor()
 
 
 def _date_from_str(s: str) -> dt.date:
@@ -25,46 +73,106 @@ def _key_for_date(dataset_prefix: str, d: dt.date) -> str:
     return f"{dataset_prefix}/{d.year:04d}/{d.month:02d}/{d.strftime('%Y-%m-%d')}.csv.gz"
 
 
-def download_key(key: str, out_path: Path, cfg: FlatfileConfig | None = None) -> Path:
+def download_key(key: str, out_path: Path, cfg: FlatfileConfig | None = None) -> Optional[Path]:
+    """Download one object; returns None when it is not available (weekends, holidays)."""
     if cfg is None:
         cfg = load_flatfile_config(required=True)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    s3 = MassiveS3(cfg)
+    s3 = get_s3(cfg)
     bucket = cfg.bucket or DEFAULT_BUCKET
-    s3.download(bucket, key, str(out_path))
+    if not s3.download(bucket, key, str(out_path)):
+        return None
     return out_path
 
 
-def download_range(dataset_prefix: str, start_date: str, end_date: str, out_dir: Path | str = "data/flatfiles", cfg: FlatfileConfig | None = None) -> List[Path]:
+def iter_download_range(
+    dataset_prefix: str,
+    start_date: str,
+    end_date: str,
+    out_dir: Path | str = "data/flatfiles",
+    cfg: FlatfileConfig | None = None,
+    *,
+    workers: int = 8,
+    include_existing: bool = False,
+) -> Iterator[Path]:
+    """
+    Download missing daily files in [start_date, end_date] on a thread pool.
+
+    Yields each newly downloaded path in date order as soon as it (and every
+    earlier day) has landed, so callers can load day N while later days are
+    still downloading. Missing days are skipped with a note. With
+    ``include_existing`` files already on disk are yielded in their date slot
+    too, so a rerun can reload days whose earlier load failed.
+    """
     if cfg is None:
         cfg = load_flatfile_config(required=True)
     out_dir = Path(out_dir)
     start = _date_from_str(start_date)
     end = _date_from_str(end_date)
-    delta = dt.timedelta(days=1)
-
+    jobs: List[tuple[str, Path]] = []
     current = start
-    downloaded: List[Path] = []
     while current <= end:
-        key = _key_for_date(dataset_prefix, current)
         dest = out_dir / dataset_prefix / f"{current.year:04d}" / f"{current.month:02d}" / f"{current.strftime('%Y-%m-%d')}.csv.gz"
+        if include_existing or not dest.exists():
+            jobs.append((_key_for_date(dataset_prefix, current), dest))
+        current += dt.timedelta(days=1)
+    if not jobs:
+        return
+
+    def fetch(job: tuple[str, Path]) -> Optional[Path]:
+        key, dest = job
         if dest.exists():
-            current += delta
-            continue
+            return dest
         try:
-            download_key(key, dest, cfg=cfg)
-            downloaded.append(dest)
+            return download_key(key, dest, cfg=cfg)
         except Exception as e:
             # Skip missing days silently for backfill; caller can inspect list
             print(f"[skip] {key} -> {dest} ({e})")
-        current += delta
-    return downloaded
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as pool:
+        for path in pool.map(fetch, jobs):
+            if path is not None:
+                yield path
+
+
+def download_range(
+    dataset_prefix: str,
+    start_date: str,
+    end_date: str,
+    out_dir: Path | str = "data/flatfiles",
+    cfg: FlatfileConfig | None = None,
+    *,
+    workers: int = 8,
+    include_existing: bool = False,
+) -> List[Path]:
+    return list(
+        iter_download_range(
+            dataset_prefix, start_date, end_date, out_dir, cfg, workers=workers, include_existing=include_existing
+        )
+    )
+
+
+def s3_url(dataset_prefix: str, date: str, cfg: FlatfileConfig) -> str:
+    key = _key_for_date(dataset_prefix, _date_from_str(date))
+    return f"s3://{cfg.bucket or DEFAULT_BUCKET}/{key}"
+
+
+def _configure_s3(con: duckdb.DuckDBPyConnection, cfg: FlatfileConfig) -> None:
+    """Point DuckDB's httpfs at the Massive S3 endpoint so s3:// paths stream via range reads."""
+    scheme, _, host = cfg.endpoint.partition("://")
+    con.execute("INSTALL httpfs")
+    con.execute("LOAD httpfs")
+    con.execute("SET s3_access_key_id=?", [cfg.access_key])
+    con.execute("SET s3_secret_access_key=?", [cfg.secret_key])
+    con.execute("SET s3_endpoint=?", [host or scheme])
+    con.execute("SET s3_url_style='path'")
+    con.execute("SET s3_use_ssl=?", [scheme != "http"])
 
 
 def list_keys(prefix: str, year: int, month: int, cfg: FlatfileConfig | None = None) -> List[str]:
     if cfg is None:
         cfg = load_flatfile_config(required=True)
-    s3 = MassiveS3(cfg)
+    s3 = get_s3(cfg)
     bucket = cfg.bucket or DEFAULT_BUCKET
     full_prefix = f"{prefix}/{year:04d}/{month:02d}/"
     # Use s3.list_objects and extract keys
@@ -122,16 +230,16 @@ def parse_opra_contract(symbol: str) -> Optional[Dict[str, object]]:
 # Loader helpers
 # --------------------
 
-def _pick_column(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
+def _pick_column(columns: Iterable[str], candidates: List[str]) -> Optional[str]:
+    columns = set(columns)
     for c in candidates:
-        if c in df.columns:
+        if c in columns:
             return c
     return None
 
 
-def _row_ts(row, ts_col: Optional[str], ts_hint: Optional[str]) -> Optional[str]:
-    if ts_col and pd.notna(row.get(ts_col)):
-        val = row.get(ts_col)
+def _ts_value(val, ts_hint: Optional[str]) -> Optional[str]:
+    if val is not None and not (isinstance(val, float) and math.isnan(val)):
         try:
             # If numeric epoch (ms or s)
             if isinstance(val, (int, float)) or str(val).isdigit():
@@ -147,50 +255,120 @@ def _row_ts(row, ts_col: Optional[str], ts_hint: Optional[str]) -> Optional[str]
     return ts_hint
 
 
-def load_option_file(path: Path, db_path: str, table: str, ts_hint: Optional[str] = None) -> int:
-    df = pd.read_csv(path)
-    if df.empty:
-        return 0
+def _csv_scan(con: duckdb.DuckDBPyConnection, path: Path | str) -> tuple[str, list, List[str]]:
+    """
+    Return (scan SQL, bind params, header) for a CSV flatfile.
 
-    contract_col = _pick_column(df, ["symbol", "contract", "sym", "ticker"])
-    o_col = _pick_column(df, ["o", "open"])
-    h_col = _pick_column(df, ["h", "high"])
-    l_col = _pick_column(df, ["l", "low"])
-    c_col = _pick_column(df, ["c", "close"])
-    v_col = _pick_column(df, ["v", "volume"])
-    n_col = _pick_column(df, ["n", "transactions", "trade_count"])
-    ts_col = _pick_column(df, ["t", "ts", "timestamp", "time", "window_start"])
-
-    rows: List[tuple] = []
-    for _, row in df.iterrows():
-        contract = str(row.get(contract_col)) if contract_col else None
-        parsed = parse_opra_contract(contract or "")
-        if not parsed:
-            continue
-        ts_val = _row_ts(row, ts_col, ts_hint)
-        if not ts_val:
+    Only the header is read to identify the layout. Known Massive files are then
+    scanned with an explicit column/type map; anything else falls back to
+    read_csv_auto's sampling.
+    """
+    header = [
+        r[0]
+        for r in con.execute(
+            "DESCRIBE SELECT * FROM read_csv(?, header=true, all_varchar=true, sample_size=1)",
+            [str(path)],
+        ).fetchall()
+    ]
+    if set(header) == set(STOCK_AGGS_SCHEMA):
+        columns = {name: STOCK_AGGS_SCHEMA[name] for name in header}
+        scan = "read_csv(?, header=true, columns=?, buffer_size=16777216)"
+        return scan, [str(path), columns], header
+    return "read_csv_auto(?, header=true)", [str(path)], header
+
+
+def export_universe_parquet(db_path: str, out_path: Path | str = UNIVERSE_PARQUET) -> int:
+    """Snapshot the enabled universe to Parquet for ``universe=`` filtering; returns ticker count."""
+    tickers = [t for t, _ in get_db(db_path).list_universe(enabled_only=True)]
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.table({"ticker": pa.array(tickers, pa.string())}), out_path)
+    return len(tickers)
+
+
+def _register_watch(
+    con: duckdb.DuckDBPyConnection,
+    tickers: Optional[List[str]],
+    universe: Path | str | None = None,
+) -> bool:
+    """
+    Expose the ticker filter to DuckDB as a ``watch`` relation.
+
+    Explicit ``tickers`` are registered as an Arrow table; otherwise ``universe``
+    (see ``export_universe_parquet``) is mounted as a view. Queries SEMI JOIN
+    against it, which DuckDB runs as a hash join on the small side instead of a
+    literal IN list that grows with the universe. Returns False when there is
+    nothing to filter on.
+    """
+    wanted = {t.upper().strip() for t in tickers or [] if t}
+    if wanted:
+        con.register("watch", pa.table({"ticker": sorted(wanted)}))
+        return True
+    if universe is not None and Path(universe).exists():
+        path_sql = Path(universe).as_posix().replace("'", "''")
+        con.execute(f"CREATE TEMP VIEW watch AS SELECT ticker FROM read_parquet('{path_sql}')")
+        return True
+    return False
+
+
+def _row_ts(row, ts_col: Optional[str], ts_hint: Optional[str]) -> Optional[str]:
+    return _ts_value(row.get(ts_col) if ts_col else None, ts_hint)
+
+
+def load_option_file(
+    path: Path,
+    db_path: str,
+    table: str,
+    ts_hint: Optional[str] = None,
+    *,
+    db_con: sqlite3.Connection | None = None,
+) -> int:
+    """Load an options aggregates flatfile; ``db_con`` (from ``DB.session()``) defers the commit to the caller."""
+    db = get_db(db_path)
+    total = 0
+    for df in pd.read_csv(path, chunksize=CHUNK_ROWS):
+        if df.empty:
             continue
 
-        rows.append(
-            (
-                ts_val,
-                contract,
-                parsed["ticker"],
-                parsed["expiry"],
-                parsed["right"],
-                parsed["strike"],
-                float(row.get(o_col)) if o_col and pd.notna(row.get(o_col)) else None,
-                float(row.get(h_col)) if h_col and pd.notna(row.get(h_col)) else None,
-                float(row.get(l_col)) if l_col and pd.notna(row.get(l_col)) else None,
-                float(row.get(c_col)) if c_col and pd.notna(row.get(c_col)) else None,
-                int(row.get(v_col)) if v_col and pd.notna(row.get(v_col)) else None,
-                int(row.get(n_col)) if n_col and pd.notna(row.get(n_col)) else None,
+        contract_col = _pick_column(df.columns, ["symbol", "contract", "sym", "ticker"])
+        o_col = _pick_column(df.columns, ["o", "open"])
+        h_col = _pick_column(df.columns, ["h", "high"])
+        l_col = _pick_column(df.columns, ["l", "low"])
+        c_col = _pick_column(df.columns, ["c", "close"])
+        v_col = _pick_column(df.columns, ["v", "volume"])
+        n_col = _pick_column(df.columns, ["n", "transactions", "trade_count"])
+        ts_col = _pick_column(df.columns, ["t", "ts", "timestamp", "time", "window_start"])
+
+        rows: List[tuple] = []
+        for _, row in df.iterrows():
+            contract = str(row.get(contract_col)) if contract_col else None
+            parsed = parse_opra_contract(contract or "")
+            if not parsed:
+                continue
+            ts_val = _row_ts(row, ts_col, ts_hint)
+            if not ts_val:
+                continue
+
+            rows.append(
+                (
+                    ts_val,
+                    contract,
+                    parsed["ticker"],
+                    parsed["expiry"],
+                    parsed["right"],
+                    parsed["strike"],
+                    float(row.get(o_col)) if o_col and pd.notna(row.get(o_col)) else None,
+                    float(row.get(h_col)) if h_col and pd.notna(row.get(h_col)) else None,
+                    float(row.get(l_col)) if l_col and pd.notna(row.get(l_col)) else None,
+                    float(row.get(c_col)) if c_col and pd.notna(row.get(c_col)) else None,
+                    int(row.get(v_col)) if v_col and pd.notna(row.get(v_col)) else None,
+                    int(row.get(n_col)) if n_col and pd.notna(row.get(n_col)) else None,
+                )
             )
-        )
 
-    db = get_db(db_path)
-    db.insert_option_bars(table, rows)
-    return len(rows)
+        db.insert_option_bars(table, rows, con=db_con)
+        total += len(rows)
+    return total
 
 
 def load_stock_file(
@@ -199,43 +377,190 @@ def load_stock_file(
     *,
     ts_hint: Optional[str] = None,
     tickers: Optional[List[str]] = None,
+    universe: Path | str | None = None,
     source: str = "flatfile:stocks_day_aggs",
+    cfg: FlatfileConfig | None = None,
+    db_con: sqlite3.Connection | None = None,
 ) -> int:
-    df_iter = pd.read_csv(path, chunksize=200_000)
+    """
+    Load a stock aggregates flatfile into market_last.
+
+    ``path`` may be a local file or an ``s3://`` URL (see ``s3_url``); remote
+    files are read in place through DuckDB httpfs without a local download.
+
+    The ticker filter and column projection run inside DuckDB's CSV scan, so only
+    the matching (symbol, close, ts) tuples ever reach Python, and they are
+    streamed out in CHUNK_ROWS batches rather than materialized at once.
+    Filter with explicit ``tickers`` or a ``universe`` Parquet snapshot.
+    Pass ``db_con`` from ``DB.session()`` to write inside the caller's transaction.
+    """
+    con = _duck()
+    if str(path).startswith("s3://"):
+        _configure_s3(con, cfg or load_flatfile_config(required=True))
+    scan, params, columns = _csv_scan(con, path)
+    symbol_col = _pick_column(columns, ["ticker", "symbol", "sym"])
+    close_col = _pick_column(columns, ["c", "close"])
+    ts_col = _pick_column(columns, ["t", "ts", "timestamp", "time"])
+    if not symbol_col or not close_col:
+        con.close()
+        return 0
+
+    symbol_expr = f'upper(trim(CAST(src."{symbol_col}" AS VARCHAR)))'
+    close_expr = f'TRY_CAST(src."{close_col}" AS DOUBLE)'
+    ts_expr = f'src."{ts_col}"' if ts_col else "NULL"
+    source_sql = f"{scan} AS src"
+    if _register_watch(con, tickers, universe):
+        source_sql += f" SEMI JOIN watch ON {symbol_expr} = watch.ticker"
+    sql = (
+        f"SELECT {symbol_expr}, {close_expr}, {ts_expr} FROM {source_sql} "
+        f"WHERE {symbol_expr} <> '' AND {close_expr} IS NOT NULL"
+    )
+
     db = get_db(db_path)
-    wanted = {t.upper().strip() for t in tickers or [] if t}
+    cur = con.execute(sql, params)
     total = 0
+    while True:
+        batch = cur.fetchmany(CHUNK_ROWS)
+        if not batch:
+            break
+        rows: List[tuple] = []
+        for symbol, close_val, ts_raw in batch:
+            ts_val = _ts_value(ts_raw, ts_hint)
+            if not ts_val:
+                continue
+            rows.append((symbol, ts_val, float(close_val), source))
+        total += db.upsert_market_last(rows, con=db_con)
+    con.close()
+    return total
 
-    for chunk in df_iter:
-        if chunk.empty:
-            continue
-        symbol_col = _pick_column(chunk, ["ticker", "symbol", "sym"])
-        close_col = _pick_column(chunk, ["c", "close"])
-        ts_col = _pick_column(chunk, ["t", "ts", "timestamp", "time"])
-        if not symbol_col or not close_col:
-            continue
 
-        if wanted:
-            series = chunk[symbol_col].astype(str).str.upper()
-            chunk = chunk[series.isin(wanted)]
-            if chunk.empty:
-                continue
+def _stock_day_rows(
+    con: duckdb.DuckDBPyConnection,
+    path: Path | str,
+    date: str,
+    tickers: Optional[List[str]],
+    universe: Path | str | None,
+) -> int:
+    """Scan a stocks day-aggs file once into the ``day_rows`` temp table; returns its row count."""
+    scan, params, columns = _csv_scan(con, path)
+    picked = {
+        "ticker": _pick_column(columns, ["ticker", "symbol", "sym"]),
+        "open": _pick_column(columns, ["o", "open"]),
+        "high": _pick_column(columns, ["h", "high"]),
+        "low": _pick_column(columns, ["l", "low"]),
+        "close": _pick_column(columns, ["c", "close"]),
+        "volume": _pick_column(columns, ["v", "volume"]),
+    }
+    if not picked["ticker"] or not picked["close"]:
+        return 0
 
-        for _, row in chunk.iterrows():
-            symbol = str(row.get(symbol_col) or "").upper().strip()
-            if not symbol:
-                continue
-            try:
-                close_val = float(row.get(close_col))
-            except Exception:
-                continue
-            ts_val = _row_ts(row, ts_col, ts_hint) or ts_hint
+    ts_col = _pick_column(columns, ["t", "ts", "timestamp", "time"])
+    symbol_expr = f'upper(trim(CAST(src."{picked["ticker"]}" AS VARCHAR)))'
+    fields = [f"{symbol_expr} AS ticker", "CAST(? AS VARCHAR) AS dt"]
+    for name in ("open", "high", "low", "close", "volume"):
+        col = picked[name]
+        fields.append(f'TRY_CAST(src."{col}" AS DOUBLE) AS {name}' if col else f"CAST(NULL AS DOUBLE) AS {name}")
+    fields.append(f'src."{ts_col}" AS ts_raw' if ts_col else "NULL AS ts_raw")
+    source_sql = f"{scan} AS src"
+    if _register_watch(con, tickers, universe):
+        source_sql += f" SEMI JOIN watch ON {symbol_expr} = watch.ticker"
+    select = f"SELECT {', '.join(fields)} FROM {source_sql} WHERE {symbol_expr} <> ''"
+
+    con.execute(f"CREATE TEMP TABLE day_rows AS {select}", [date, *params])
+    return int(con.execute("SELECT COUNT(*) FROM day_rows").fetchone()[0])
+
+
+def _copy_day_rows_parquet(con: duckdb.DuckDBPyConnection, out_dir: Path | str) -> None:
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    con.execute(
+        "COPY (SELECT ticker, dt, open, high, low, close, volume FROM day_rows) "
+        f"TO '{Path(out_dir).as_posix()}' "
+        "(FORMAT PARQUET, PARTITION_BY (ticker, dt), COMPRESSION ZSTD, OVERWRITE_OR_IGNORE)"
+    )
+
+
+def export_stock_day_parquet(
+    path: Path | str,
+    date: str,
+    *,
+    tickers: Optional[List[str]] = None,
+    universe: Path | str | None = None,
+    out_dir: Path | str = STOCK_DAY_PARQUET_DIR,
+    cfg: FlatfileConfig | None = None,
+) -> int:
+    """Write a stocks day-aggs file into the per-ticker Parquet layout; returns rows written."""
+    con = _duck()
+    if str(path).startswith("s3://"):
+        _configure_s3(con, cfg or load_flatfile_config(required=True))
+    written = _stock_day_rows(con, path, date, tickers, universe)
+    if written:
+        _copy_day_rows_parquet(con, out_dir)
+    con.close()
+    return written
+
+
+def load_stock_day_file(
+    path: Path | str,
+    db_path: str,
+    date: str,
+    *,
+    tickers: Optional[List[str]] = None,
+    universe: Path | str | None = None,
+    source: str = "flatfile:stocks_day_aggs",
+    out_dir: Path | str = STOCK_DAY_PARQUET_DIR,
+    cfg: FlatfileConfig | None = None,
+    db_con: sqlite3.Connection | None = None,
+) -> tuple[int, int]:
+    """
+    ``load_stock_file`` plus ``export_stock_day_parquet`` from a single CSV scan.
+
+    Day-aggregate files only; minute files must not reach the day Parquet
+    layout and go through ``load_stock_file`` alone.
+
+    The file is decompressed and parsed once into a DuckDB temp table that feeds
+    both the Parquet COPY and the market_last upsert. Returns
+    (market_last rows loaded, Parquet rows written).
+    """
+    con = _duck()
+    if str(path).startswith("s3://"):
+        _configure_s3(con, cfg or load_flatfile_config(required=True))
+    written = _stock_day_rows(con, path, date, tickers, universe)
+    if not written:
+        con.close()
+        return 0, 0
+    _copy_day_rows_parquet(con, out_dir)
+
+    db = get_db(db_path)
+    cur = con.execute("SELECT ticker, close, ts_raw FROM day_rows WHERE close IS NOT NULL")
+    loaded = 0
+    while True:
+        batch = cur.fetchmany(CHUNK_ROWS)
+        if not batch:
+            break
+        rows: List[tuple] = []
+        for symbol, close_val, ts_raw in batch:
+            ts_val = _ts_value(ts_raw, date)
             if not ts_val:
                 continue
-            db.set_market_last(symbol, ts_val, close_val, source=source)
-            total += 1
+            rows.append((symbol, ts_val, float(close_val), source))
+        loaded += db.upsert_market_last(rows, con=db_con)
+    con.close()
+    return loaded, written
 
-    return total
+
+def read_stock_day_parquet(ticker: str, root: Path | str = STOCK_DAY_PARQUET_DIR) -> Optional[pd.DataFrame]:
+    """Daily OHLCV for one ticker from the Parquet layout (only that ticker's partition is scanned)."""
+    part = Path(root) / f"ticker={ticker.upper().strip()}"
+    if not part.is_dir():
+        return None
+    con = _duck()
+    df = con.execute(
+        "SELECT CAST(dt AS VARCHAR) AS date, open, high, low, close, volume "
+        "FROM read_parquet(?, hive_partitioning=1) ORDER BY dt",
+        [f"{part.as_posix()}/*/*.parquet"],
+    ).df()
+    con.close()
+    return df if not df.empty else None
 
 
 # --------------------
@@ -264,7 +589,7 @@ def build_strike_candidates(underlying: str, expiry: str, date: str, *, db_path:
     db = get_db(db_path)
     day_rows: List[tuple] = []
     minute_rows: List[tuple] = []
-    with db.connect() as con:
+    with db.session() as con:
         day_rows = con.execute(
             """
             SELECT contract, strike, o, h, l, c, v, transactions
@@ -356,7 +681,13 @@ __all__ = [
     "download_key",
     "download_range",
     "list_keys",
+    "s3_url",
     "load_option_file",
+    "load_stock_file",
+    "export_stock_day_parquet",
+    "load_stock_day_file",
+    "export_universe_parquet",
+    "read_stock_day_parquet",
     "build_strike_candidates",
     "parse_opra_contract",
 ]
@@ -1,15 +1,21 @@
 from __future__ import annotations
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
 from .config import FlatfileConfig
-from .s3_flatfiles import MassiveS3
+from .flatfiles import export_stock_day_parquet, load_stock_file
+from .s3_flatfiles import MassiveS3, get_s3
 from .store import DB
 
 
 RAW_DIR = Path("data/raw")
-RAW_DIR.mkdir(parents=True, exist_ok=True)
+STOCKS_RAW_DIR = RAW_DIR / "stocks"
+OPTIONS_RAW_DIR = RAW_DIR / "options"
+STOCKS_RAW_DIR.mkdir(parents=True, exist_ok=True)
+OPTIONS_RAW_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def _date_str(d: datetime) -> str:
@@ -40,19 +46,16 @@ def ingest_daily(
     max_backshift_days: int = 30,
     download_stocks: bool = True,
     download_options: bool = False,
+    s3: MassiveS3 | None = None,
 ) -> str:
     """
     Downloads Massive flatfiles for a date into data/raw/... and records an ingest event.
 
     Returns the date actually ingested (could be backshifted if requested date not available).
+    Pass ``s3`` to reuse a client across calls; defaults to the shared one for ``cfg``.
     """
-    s3 = MassiveS3(cfg)
-
-    # Ensure folders
-    stocks_out = RAW_DIR / "stocks"
-    options_out = RAW_DIR / "options"
-    stocks_out.mkdir(parents=True, exist_ok=True)
-    options_out.mkdir(parents=True, exist_ok=True)
+    if s3 is None:
+        s3 = get_s3(cfg)
 
     attempt_date = date_yyyy_mm_dd
     for i in range(max_backshift_days + 1):
@@ -60,7 +63,7 @@ def ingest_daily(
         stock_key = stock_dest = None
         if download_stocks:
             stock_key = _stock_daily_key(cfg, attempt_date)
-            stock_dest = str(stocks_out / f"{attempt_date}.csv.gz")
+            stock_dest = str(STOCKS_RAW_DIR / f"{attempt_date}.csv.gz")
             ok_stock = s3.download(cfg.bucket, stock_key, stock_dest)
 
         ok_opt = True
@@ -68,7 +71,7 @@ def ingest_daily(
 
         if download_options:
             opt_key = _options_daily_key(cfg, attempt_date)
-            opt_dest = str(options_out / f"{attempt_date}.csv.gz")
+            opt_dest = str(OPTIONS_RAW_DIR / f"{attempt_date}.csv.gz")
             ok_opt = s3.download(cfg.bucket, opt_key, opt_dest)
 
         if ok_stock and ok_opt:
@@ -102,3 +105,68 @@ def ingest_daily(
     raise RuntimeError(
         f"Could not ingest any date within backshift window. Start={date_yyyy_mm_dd} days={max_backshift_days}"
     )
+
+
+def ingest_range(
+    cfg: FlatfileConfig,
+    db: DB,
+    start: str,
+    end: str,
+    *,
+    workers: int = 8,
+    universe: Path | str | None = None,
+    s3: MassiveS3 | None = None,
+) -> list[str]:
+    """
+    Download and load stock day aggregates for every weekday in [start, end].
+
+    Each day is downloaded (boto3 clients are thread-safe) and written to the
+    per-ticker Parquet layout on a thread pool; every export gets its own cursor
+    on the shared DuckDB database, which releases the GIL while it scans. A day
+    that fails is logged and skipped so the days that landed are still recorded.
+    Only the newest day is loaded into market_last, since older days would just
+    be overwritten. Returns the dates ingested, oldest first.
+    """
+    if s3 is None:
+        s3 = get_s3(cfg)
+    day = datetime.strptime(start, "%Y-%m-%d")
+    last = datetime.strptime(end, "%Y-%m-%d")
+    days: list[str] = []
+    while day <= last:
+        if day.weekday() < 5:
+            days.append(_date_str(day))
+        day += timedelta(days=1)
+    if not days:
+        return []
+
+    def ingest_day(date: str) -> Optional[Path]:
+        dest = STOCKS_RAW_DIR / f"{date}.csv.gz"
+        if not dest.exists() and not s3.download(cfg.bucket, _stock_daily_key(cfg, date), str(dest)):
+            return None
+        export_stock_day_parquet(dest, date, universe=universe)
+        return dest
+
+    fetched: list[tuple[str, Path]] = []
+    failed: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(days)))) as pool:
+        futures = [(d, pool.submit(ingest_day, d)) for d in days]
+        for date, fut in futures:
+            try:
+                path = fut.result()
+            except Exception as e:
+                print(f"[ingest] {date} failed: {e}")
+                failed[date] = str(e)
+                continue
+            if path is not None:
+                fetched.append((date, path))
+
+    payload: dict = {"start": start, "end": end, "dates": [d for d, _ in fetched]}
+    if failed:
+        payload["failed"] = failed
+    if fetched:
+        newest, newest_path = fetched[-1]
+        load_stock_file(newest_path, db.path, ts_hint=newest, universe=universe)
+        payload["market_last_date"] = newest
+    if fetched or failed:
+        db.log_event(event_type="ingest_range", payload=payload)
+    return [d for d, _ in fetched]
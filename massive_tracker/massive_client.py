@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import datetime as dt
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 import pandas as pd
+import threading
 import time
 
 
@@ -27,7 +29,9 @@ def _api_token() -> str | None:
     return CFG.massive_api_key or (CFG.massive_key_id or None)
 
 
-def _init_client():
+@lru_cache(maxsize=1)
+def _rest_client():
+    """Process-wide REST client, built on first use so its connection pool is reused."""
     token = _api_token()
     if RESTClient is None or not token:
         return None
@@ -62,20 +66,22 @@ def _ts_from_ns(val: Any) -> str | None:
 _LAST_CALL_TS = 0.0
 _CALL_DELAY = 15.0 # Strict 5 calls/min = 12s, 15s for safety
 
+_THROTTLE_LOCK = threading.Lock()
+
 def _throttle():
+    """Reserve the next call slot under a lock so concurrent callers still honour the rate limit."""
     global _LAST_CALL_TS
-    now = time.time()
-    elapsed = now - _LAST_CALL_TS
-    if elapsed < _CALL_DELAY:
-        wait = _CALL_DELAY - elapsed
+    with _THROTTLE_LOCK:
+        now = time.time()
+        slot = max(now, _LAST_CALL_TS + _CALL_DELAY)
+        _LAST_CALL_TS = slot
+    wait = slot - now
+    if wait > 0:
         print(f"[MASSIVE] Rate limiting... sleeping {wait:.1f}s")
         time.sleep(wait)
-    _LAST_CALL_TS = time.time()
-
-rest = _init_client()
-
 
 def _sdk_get(path: str, params: dict | None = None) -> dict:
+    rest = _rest_client()
     if rest is None:
         raise RuntimeError("Massive REST client unavailable. Install `massive` and set MASSIVE_ACCESS_KEY/MASSIVE_KEY_ID.")
     
@@ -231,6 +237,7 @@ def get_stock_last_quote(ticker: str) -> tuple[float | None, str | None, str]:
 def get_option_last_quote(option_contract: str) -> tuple[float | None, str | None, str]:
     """Return (mid, ts, source) for an option contract via REST list_quotes (options-only friendly)."""
     token = _api_token()
+    rest = _rest_client()
     if rest is None or not token:
         return None, None, "massive_rest:option_quote"
 
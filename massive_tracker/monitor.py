@@ -128,7 +128,7 @@ def _db_try_get_last_stock_price(db: DB, ticker: str) -> Optional[float]:
     Adjust table/column names to your actual schema when you confirm it.
     """
     try:
-        with db.connect() as con:
+        with db.session() as con:
             # Common patterns: prices_daily(ticker, close, date) or bars(...)
             row = con.execute(
                 "SELECT close FROM prices_daily WHERE ticker=? ORDER BY date DESC LIMIT 1",
@@ -146,7 +146,7 @@ def _db_try_get_last_option_mid(db: DB, ticker: str, expiry: str, right: str, st
     Best-effort fallback if you store option mids in sqlite.
     """
     try:
-        with db.connect() as con:
+        with db.session() as con:
             row = con.execute(
                 """
                 SELECT mid
@@ -202,7 +202,7 @@ def _get_position_details_fallback(wl: Watchlists, position_id: int) -> Dict[str
     else:
         # Try direct SQL against likely columns; ignore failures.
         try:
-            with wl.db.connect() as con:  # type: ignore
+            with wl.db.session() as con:  # type: ignore
                 row = con.execute(
                     """
                     SELECT shares, stock_basis, premium_open
@@ -5,6 +5,7 @@ import math
 import pathlib
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
@@ -12,6 +13,8 @@ import pandas as pd
 
 
 from .config import CFG
+from .flatfile_manager import ticker_glob
+from .flatfiles import _duck, read_stock_day_parquet
 from .store import get_db
 
 
@@ -324,31 +327,33 @@ def fetch_ohlcv_massive_daily(
     return df
 
 
-def fetch_ohlcv_local_flatfile(ticker: str) -> Optional[pd.DataFrame]:
-    """Load and resample 1-minute flatfiles to daily bars."""
-    path = pathlib.Path(f"data/flatfiles/stocks_1m/{ticker.upper()}.csv")
-    if not path.exists():
+def fetch_ohlcv_local_flatfile(ticker: str, since: Optional[dt.date] = None) -> Optional[pd.DataFrame]:
+    """Daily bars rolled up from the 1-minute Parquet flatfiles inside DuckDB."""
+    pattern = ticker_glob(ticker)
+    if pattern is None:
         return None
+    # Month partitions before `since` are pruned by hive filter; only OHLCV columns are decoded.
+    where = "WHERE date >= ?" if since else ""
+    params = [pattern] + ([since.strftime("%Y-%m")] if since else [])
     try:
-        df = pd.read_csv(path)
-        if df.empty or 'timestamp' not in df.columns:
-            return None
-            
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df.set_index('timestamp', inplace=True)
-        
-        # Resample 1m to 1D
-        daily = df.resample('D').agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        }).dropna()
-        
-        # Format to match Massive output
-        daily = daily.reset_index().rename(columns={'timestamp': 'date'})
-        return daily
+        with _duck() as con:
+            daily = con.execute(
+                f"""
+                SELECT CAST(timestamp AS DATE) AS date,
+                       arg_min(open, timestamp) AS open,
+                       max(high) AS high,
+                       min(low) AS low,
+                       arg_max(close, timestamp) AS close,
+                       sum(volume) AS volume
+                FROM read_parquet(?, hive_partitioning=1, hive_types={{'date': VARCHAR}})
+                {where}
+                GROUP BY 1
+                ORDER BY 1
+                """,
+                params,
+            ).df()
+        daily = daily.dropna()
+        return daily if not daily.empty else None
     except Exception as e:
         print(f"[OCED] Local file read failed for {ticker}: {e}")
         return None
@@ -365,7 +370,7 @@ def get_ohlcv_daily(
     end_date: dt.date,
 ) -> pd.DataFrame:
     # 1. Try local flatfiles first (Resampled)
-    df = fetch_ohlcv_local_flatfile(ticker)
+    df = fetch_ohlcv_local_flatfile(ticker, since=start_date)
     if df is not None and not df.empty:
         # Filter for requested range
         df['date_dt'] = pd.to_datetime(df['date']).dt.date
@@ -374,7 +379,16 @@ def get_ohlcv_daily(
         if not filtered.empty:
             return filtered[['date', 'open', 'high', 'low', 'close', 'volume']]
 
-    # 2. Fallback to Massive REST API
+    # 2. Day-aggregate Parquet layout (partition-pruned to this ticker)
+    df = read_stock_day_parquet(ticker)
+    if df is not None and not df.empty:
+        df['date_dt'] = pd.to_datetime(df['date']).dt.date
+        mask = (df['date_dt'] >= start_date) & (df['date_dt'] <= end_date)
+        filtered = df.loc[mask].copy()
+        if not filtered.empty:
+            return filtered[['date', 'open', 'high', 'low', 'close', 'volume']]
+
+    # 3. Fallback to Massive REST API
     df = fetch_ohlcv_massive_daily(ticker, start_date, end_date)
     if df is not None and not df.empty:
         return df
@@ -475,22 +489,22 @@ def load_and_train_premium_model(csv_path: str) -> Tuple[Optional[Any], Optional
     return model, metrics
 
 
-PREMIUM_MODEL: Optional[Any] = None
-PREMIUM_MODEL_METRICS: Optional[Dict[str, float]] = None
-HISTORICAL_DATA_PATH = CFG.premium_history_csv
-
-if pathlib.Path(HISTORICAL_DATA_PATH).exists():
-    model, metrics = load_and_train_premium_model(HISTORICAL_DATA_PATH)
-    PREMIUM_MODEL = model
-    PREMIUM_MODEL_METRICS = metrics
+@lru_cache(maxsize=1)
+def get_premium_model() -> Tuple[Optional[Any], Optional[Dict[str, float]]]:
+    """Train on CFG.premium_history_csv on first use (not at import); (None, None) if the file is absent."""
+    csv_path = CFG.premium_history_csv
+    if not pathlib.Path(csv_path).exists():
+        return None, None
+    return load_and_train_premium_model(csv_path)
 
 
 def ml_adjust_premium(base_row: Dict[str, Any], heuristic_premium_100: float) -> float:
-    if PREMIUM_MODEL is None:
+    model, _metrics = get_premium_model()
+    if model is None:
         return heuristic_premium_100
 
     feats = [float(base_row.get(f, 0.0)) for f in ML_FEATURES]
-    pred = float(PREMIUM_MODEL.predict([feats])[0])  # type: ignore[arg-type]
+    pred = float(model.predict([feats])[0])  # type: ignore[arg-type]
     blended = 0.6 * pred + 0.4 * heuristic_premium_100
     return float(max(blended, 0.0))
 
@@ -613,7 +627,7 @@ def _persist_scores(db: DB, run_ts: str, rows: List[Dict[str, Any]]) -> None:
             )
         )
 
-    with db.connect() as con:
+    with db.session() as con:
         con.executemany(
             """
             INSERT OR REPLACE INTO oced_scores (
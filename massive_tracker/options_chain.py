@@ -4,7 +4,7 @@ from typing import List
 from datetime import datetime, timezone
 
 from .massive_client import get_option_chain_snapshot
-from .store import DB
+from .store import DB, get_db
 from .flatfiles import build_strike_candidates
 
 DEFAULT_DB_PATH = "data/sqlite/tracker.db"
@@ -66,7 +66,7 @@ def _fetch_from_massive(ticker: str, expiry: str) -> List[dict]:
 def _latest_option_date(db: DB, ticker: str, expiry: str) -> str | None:
     ticker = ticker.upper().strip()
     expiry = expiry.strip()
-    with db.connect() as con:
+    with db.session() as con:
         row = con.execute(
             "SELECT MAX(ts) FROM option_bars_1d WHERE ticker=? AND expiry=?",
             (ticker, expiry),
@@ -85,7 +85,7 @@ def _latest_option_date(db: DB, ticker: str, expiry: str) -> str | None:
 def _fetch_from_flatfiles(ticker: str, expiry: str, db_path: str) -> List[dict]:
     """Bootstrap chain from flatfile strike candidates (approx)."""
     try:
-        db = DB(db_path)
+        db = get_db(db_path)
         latest_day = _latest_option_date(db, ticker, expiry) or datetime.utcnow().strftime("%Y-%m-%d")
         bars = build_strike_candidates(ticker, expiry, latest_day, db_path=db_path)
     except Exception:
@@ -124,7 +124,7 @@ def get_option_chain(
     When return_source=True, returns (quotes, source_tag).
     """
 
-    db = DB(db_path)
+    db = get_db(db_path)
     source = "missing_chain"
     if use_cache:
         cached = db.get_option_chain(ticker=ticker, expiry=expiry, max_age_minutes=max_age_minutes)
@@ -6,7 +6,7 @@ import os
 
 from math import sqrt
 
-from .store import DB
+from .store import DB, get_db
 from .massive_client import get_stock_last_price
 from .stock_ml import run_stock_ml, select_strike
 from .watchlist import Watchlists
@@ -39,7 +39,7 @@ def _next_friday(base: datetime) -> str:
 
 def _pick_expiry_from_contracts(db: DB, ticker: str, fallback: str) -> str:
     ticker = ticker.upper().strip()
-    with db.connect() as con:
+    with db.session() as con:
         row = con.execute(
             """
             SELECT expiration_date
@@ -438,7 +438,7 @@ def run_weekly_picker(
     - Output: rows in weekly_picks (one per ticker, no contracts).
     """
 
-    db = DB(db_path)
+    db = get_db(db_path)
     sync_universe(db)
     universe_rows = db.list_universe(enabled_only=True)
     tickers = [t for t, _ in universe_rows] or get_universe()
@@ -54,7 +54,7 @@ def promote_from_weekly_picks(
     default_expiry = _next_friday(datetime.utcnow())
 
     existing_keys = set()
-    with db.connect() as con:
+    with db.session() as con:
         rows = con.execute(
             """
             SELECT ticker, expiry, right, strike
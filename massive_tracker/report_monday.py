@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 from typing import Iterable
 
-from .store import DB
+from .store import get_db
 
 
 REPORT_DIR = Path("data/reports")
@@ -49,7 +49,7 @@ def _fresh(ts: str | None, window_minutes: int = 20) -> bool:
 
 
 def write_monday_report(db_path: str = "data/sqlite/tracker.db") -> str:
-    db = DB(db_path)
+    db = get_db(db_path)
     run_ts = datetime.now(timezone.utc)
     date_str = run_ts.strftime("%Y-%m-%d")
     report_path = REPORT_DIR / f"monday_run_{date_str}.md"
@@ -76,7 +76,7 @@ def write_monday_report(db_path: str = "data/sqlite/tracker.db") -> str:
             stale_prices.append(t)
 
     bars_counts = {}
-    with db.connect() as con:
+    with db.session() as con:
         rows = con.execute(
             "SELECT ticker, COUNT(*) FROM price_bars_1m GROUP BY ticker"
         ).fetchall()
@@ -104,7 +104,7 @@ def write_monday_report(db_path: str = "data/sqlite/tracker.db") -> str:
     top_premium = sorted(valid_picks, key=lambda r: r.get("premium_yield") or 0.0, reverse=True)
 
     # OCED table
-    with db.connect() as con:
+    with db.session() as con:
         latest_ts_row = con.execute("SELECT MAX(ts) FROM oced_scores").fetchone()
         oced_latest = latest_ts_row[0] if latest_ts_row and latest_ts_row[0] else None
         oced_rows = []
@@ -309,7 +309,7 @@ def write_monday_report(db_path: str = "data/sqlite/tracker.db") -> str:
     lines.append("")
 
     lines.append("## End-of-Week Scoreboard")
-    with db.connect() as con:
+    with db.session() as con:
         row = con.execute("SELECT MAX(week_ending) FROM outcomes").fetchone()
         latest_week = row[0] if row and row[0] else None
         outcome_rows = []
@@ -9,7 +9,7 @@ from .summary import generate_summary
 
 from .run_profile import load_profile
 from .config import load_flatfile_config
-from .store import DB
+from .store import get_db
 from .ingest import ingest_daily
 from .weekly_rollup import run_weekly_rollup
 from .monitor import run_monitor
@@ -30,7 +30,7 @@ def run_once(db_path: str = "data/sqlite/tracker.db", date: str | None = None) -
 
     ingest_note: str | None = None
     if profile.get("auto_ingest", True):
-        db = DB(db_path)
+        db = get_db(db_path)
         flat_cfg = load_flatfile_config(required=False)
 
         if flat_cfg is None:
@@ -1,12 +1,23 @@
 from __future__ import annotations
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 import boto3
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 from massive_tracker.config import FlatfileConfig  # or passed in
 
 
+# Directories already created by this process; skips a makedirs syscall per download.
+_MADE_DIRS: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    if path and path not in _MADE_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _MADE_DIRS.add(path)
+
+
 @dataclass
 class S3Object:
     key: str
@@ -22,7 +33,11 @@ class MassiveS3:
         self.s3 = session.client(
             "s3",
             endpoint_url=cfg.endpoint,
-            config=BotoConfig(signature_version="s3v4"),
+            config=BotoConfig(
+                signature_version="s3v4",
+                max_pool_connections=32,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
         )
 
     def list_objects(self, bucket: str, prefix: str) -> list[S3Object]:
@@ -35,7 +50,7 @@ class MassiveS3:
 
     def download(self, bucket: str, key: str, dest_path: str) -> bool:
         """Download file, return True if successful, False if not available (404/403)."""
-        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(dest_path))
         try:
             self.s3.download_file(bucket, key, dest_path)
             return True
@@ -44,4 +59,10 @@ class MassiveS3:
             if code in ("403", "404", "NoSuchKey", "AccessDenied"):
                 print(f"[skip] not available: s3://{bucket}/{key} ({code})")
                 return False
-            raise RuntimeError(f"Download failed for {key}: {e}") from e
\ No newline at end of file
+            raise RuntimeError(f"Download failed for {key}: {e}") from e
+
+
+@lru_cache(maxsize=1)
+def get_s3(cfg: FlatfileConfig) -> MassiveS3:
+    """Shared client per config; boto session/client setup is paid once per process."""
+    return MassiveS3(cfg)
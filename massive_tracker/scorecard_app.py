@@ -28,13 +28,13 @@ def get_db_instance():
 def load_oced_data():
     db = get_db_instance()
     # Get last 50 scores
-    with db.connect() as con:
+    with db.session() as con:
         df = pd.read_sql_query("SELECT * FROM oced_scores ORDER BY ts DESC, CoveredCall_Suitability DESC LIMIT 200", con)
     return df
 
 def load_picks_data():
     db = get_db_instance()
-    with db.connect() as con:
+    with db.session() as con:
         df = pd.read_sql_query("SELECT * FROM weekly_picks ORDER BY ts DESC", con)
     return df
 
@@ -43,11 +43,11 @@ with st.sidebar:
     st.title("🛡️ Data Health")
     db = get_db_instance()
     try:
-        with db.connect() as con:
+        with db.session() as con:
             univ_count = con.execute("SELECT COUNT(*) FROM universe WHERE enabled=1").fetchone()[0]
             score_count = con.execute("SELECT COUNT(*) FROM oced_scores").fetchone()[0]
             pick_count = con.execute("SELECT COUNT(*) FROM weekly_picks").fetchone()[0]
-            ff_count = len(list(pathlib.Path("data/flatfiles/stocks_1m").glob("*.csv")))
+            ff_count = len(list(pathlib.Path("data/flatfiles/stocks_1m").glob("ticker=*")))
             
         st.metric("Universe", univ_count)
         st.metric("Scores", score_count)
@@ -124,7 +124,7 @@ with tabs[2]:
     
     with col1:
         st.subheader("Active Universe")
-        with db.connect() as con:
+        with db.session() as con:
             univ = pd.read_sql_query("SELECT ticker, category, added_ts FROM universe WHERE enabled=1", con)
         st.dataframe(univ, width=None, hide_index=True)
         
@@ -57,9 +57,8 @@ def test_flatfile_processing():
             mgr.append_to_flatfile(ticker, df, mode='overwrite')
             
             # Verify file exists
-            csv_path = mgr.flatfile_dir / f"{ticker}.csv"
-            if csv_path.exists():
-                logger.info(f"Flatfile successfully created: {csv_path}")
+            if ticker in mgr.get_existing_tickers():
+                logger.info(f"Flatfile successfully created: {mgr.flatfile_dir / f'ticker={ticker}'}")
                 # Verify reload
                 first, last = mgr.get_file_date_range(ticker)
                 logger.info(f"Reloaded range: {first} to {last}")
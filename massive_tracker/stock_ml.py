@@ -6,7 +6,7 @@ from typing import Dict, Optional
 import numpy as np
 
 from .oced import fetch_ohlcv_massive_daily
-from .store import DB
+from .store import get_db
 from .watchlist import Watchlists
 
 
@@ -66,7 +66,7 @@ def run_stock_ml(db_path: str = "data/sqlite/tracker.db", lookback_days: int = 5
     Compute stock-only ML-style signals (vol/risk/regime/expected move) per ticker.
     Stores results in stock_ml_signals.
     """
-    db = DB(db_path)
+    db = get_db(db_path)
     wl = Watchlists(db)
     tickers = wl.list_tickers()
     ts = dt.datetime.utcnow().isoformat()
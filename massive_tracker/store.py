@@ -1,6 +1,10 @@
+import json
 import os
 import sqlite3
-from dataclasses import dataclass
+import threading
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Iterator
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS tickers (
@@ -86,6 +90,8 @@ CREATE TABLE IF NOT EXISTS oced_scores (
 
 CREATE INDEX IF NOT EXISTS idx_oced_scores_ticker_ts
   ON oced_scores(ticker, ts);
+CREATE INDEX IF NOT EXISTS idx_oced_scores_ts
+  ON oced_scores(ts DESC);
 
 CREATE TABLE IF NOT EXISTS weekly_picks (
     ts TEXT NOT NULL,
@@ -281,6 +287,8 @@ CREATE TABLE IF NOT EXISTS universe_candidates (
     approved INTEGER DEFAULT 0,
     PRIMARY KEY (ts, ticker)
 );
+CREATE INDEX IF NOT EXISTS idx_universe_candidates_approved_ticker
+    ON universe_candidates(approved, ticker);
 
 CREATE TABLE IF NOT EXISTS weekly_pick_missing (
     ts TEXT NOT NULL,
@@ -325,17 +333,84 @@ CREATE TABLE IF NOT EXISTS audit_math (
 );
 """
 
+# Applied once per connection; the connection is then reused by every DB call.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-64000;",
+    "PRAGMA mmap_size=30000000000;",
+    "PRAGMA wal_autocheckpoint=10000;",
+)
+
+
 @dataclass
 class DB:
     path: str
+    _con: sqlite3.Connection | None = field(default=None, init=False, repr=False, compare=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False, compare=False)
 
     def connect(self) -> sqlite3.Connection:
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
-        con = sqlite3.connect(self.path)
-        con.execute("PRAGMA journal_mode=WAL;")
-        con.executescript(SCHEMA)
-        self._apply_migrations(con)
-        return con
+        """
+        Return the shared connection, opening it (schema + pragmas) on first use.
+
+        Threads share this handle, so statements and commits go through
+        ``session()``, which holds the lock for the whole unit of work.
+        """
+        with self._lock:
+            if self._con is not None:
+                try:
+                    self._con.total_changes
+                    return self._con
+                except sqlite3.ProgrammingError:
+                    # Caller closed the shared handle; reopen below.
+                    self._con = None
+
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            con = sqlite3.connect(self.path, check_same_thread=False)
+            for pragma in PRAGMAS:
+                con.execute(pragma)
+            con.executescript(SCHEMA)
+            self._apply_migrations(con)
+            con.commit()
+            self._con = con
+            return con
+
+    @contextmanager
+    def session(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the shared connection for a unit of work that commits once on exit.
+
+        Pass the yielded ``con`` to helpers that accept one (e.g. ``Watchlists``)
+        so their writes join this transaction instead of committing on their own.
+        """
+        with self._lock:
+            con = self.connect()
+            with con:
+                yield con
+
+    @contextmanager
+    def deferred_indexes(self, table: str) -> Iterator[None]:
+        """
+        Drop ``table``'s secondary indexes for a bulk load and rebuild them afterwards.
+
+        Primary-key/UNIQUE autoindexes have no stored SQL and are left alone.
+        """
+        with self.session() as con:
+            stashed = con.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name=? AND sql IS NOT NULL",
+                (table,),
+            ).fetchall()
+            for name, _sql in stashed:
+                con.execute(f'DROP INDEX IF EXISTS "{name}"')
+        try:
+            yield
+        finally:
+            if stashed:
+                with self.session() as con:
+                    for _name, sql in stashed:
+                        con.execute(sql)
+                    con.execute(f'ANALYZE "{table}"')
 
     def _apply_migrations(self, con: sqlite3.Connection) -> None:
         self._ensure_option_position_columns(con)
@@ -613,15 +688,31 @@ class DB:
 
     def set_market_last(self, ticker: str, ts: str, price: float, source: str | None = None) -> None:
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 "INSERT OR REPLACE INTO market_last(ticker, ts, price, source) VALUES(?, ?, ?, ?)",
                 (ticker, ts, float(price), source),
             )
 
+    def upsert_market_last(
+        self, rows: list[tuple[str, str, float, str | None]], *, con: sqlite3.Connection | None = None
+    ) -> int:
+        """Bulk form of set_market_last for (ticker, ts, price, source) rows.
+
+        Pass ``con`` from ``session()`` to join a larger transaction instead of committing here.
+        """
+        if not rows:
+            return 0
+        with nullcontext(con) if con is not None else self.session() as con:
+            con.executemany(
+                "INSERT OR REPLACE INTO market_last(ticker, ts, price, source) VALUES(?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
     def get_market_last(self, ticker: str) -> tuple[float, str, str | None] | tuple[None, None, None]:
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             row = con.execute(
                 "SELECT price, ts, source FROM market_last WHERE ticker=?",
                 (ticker,),
@@ -630,6 +721,18 @@ class DB:
                 return None, None, None
             return float(row[0]), str(row[1]), row[2]
 
+    def count_market_last_present(self, tickers: list[str]) -> int:
+        """Number of the given tickers with a cached market_last price."""
+        up = [t.upper().strip() for t in tickers if t]
+        if not up:
+            return 0
+        with self.session() as con:
+            row = con.execute(
+                "SELECT COUNT(*) FROM market_last WHERE ticker IN (SELECT value FROM json_each(?)) AND price IS NOT NULL",
+                (json.dumps(up),),
+            ).fetchone()
+        return int(row[0])
+
     def option_key(self, ticker: str, expiry: str, right: str, strike: float) -> str:
         return f"{ticker.upper().strip()}|{expiry}|{right.upper().strip()}|{float(strike)}"
 
@@ -651,7 +754,7 @@ class DB:
         source: str | None = None,
     ) -> None:
         k = self.option_key(ticker, expiry, right, strike)
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 """
                 INSERT OR REPLACE INTO options_last
@@ -679,7 +782,7 @@ class DB:
 
     def get_options_last(self, ticker: str, expiry: str, right: str, strike: float) -> dict | None:
         k = self.option_key(ticker, expiry, right, strike)
-        with self.connect() as con:
+        with self.session() as con:
             row = con.execute(
                 """
                 SELECT ts, bid, ask, mid, last, iv, delta, oi, volume, source
@@ -705,11 +808,30 @@ class DB:
 
     def log_event(self, event_type: str, payload: dict) -> None:
         """Log an event to ingest_state table (using dataset field for event_type)."""
-        import json
-        with self.connect() as con:
-            con.execute(
-                "INSERT OR REPLACE INTO ingest_state(dataset, last_key) VALUES(?, ?)",
-                (event_type, json.dumps(payload)),
+        self.log_events([(event_type, payload)])
+
+    def log_events(self, events: list[tuple[str, dict]]) -> None:
+        """
+        Write several ingest_state events in one transaction.
+
+        The transaction is opened with BEGIN IMMEDIATE so the WAL write lock is
+        taken up front rather than upgraded mid-transaction, which is where a
+        concurrent writer would otherwise force a busy retry.
+        """
+        if not events:
+            return
+        con = self.connect()
+        with self._lock, con:
+            if not con.in_transaction:
+                con.execute("BEGIN IMMEDIATE")
+            con.executemany(
+                """
+                INSERT INTO ingest_state(dataset, last_key) VALUES(?, ?)
+                ON CONFLICT(dataset) DO UPDATE SET
+                  last_key=excluded.last_key,
+                  last_ts=datetime('now')
+                """,
+                [(event_type, json.dumps(payload)) for event_type, payload in events],
             )
 
     def upsert_weekly_pick(self, row: dict) -> None:
@@ -843,7 +965,7 @@ class DB:
         col_list = ", ".join(cols)
         values = [data.get(c) for c in cols]
 
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 f"INSERT OR REPLACE INTO weekly_picks ({col_list}) VALUES ({placeholders})",
                 values,
@@ -860,7 +982,7 @@ class DB:
         source: str | None = None,
     ) -> None:
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 """
                 INSERT OR REPLACE INTO weekly_pick_missing(ts, ticker, stage, reason, detail, source)
@@ -882,7 +1004,7 @@ class DB:
         source_ref: str | None = None,
     ) -> None:
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 """
                 INSERT INTO audit_math(ts, stage, ticker, field, expected, actual, ok, source_ref)
@@ -892,7 +1014,7 @@ class DB:
             )
 
     def fetch_latest_weekly_picks(self) -> list[dict]:
-        with self.connect() as con:
+        with self.session() as con:
             ts_row = con.execute("SELECT MAX(ts) FROM weekly_picks").fetchone()
             if not ts_row or ts_row[0] is None:
                 return []
@@ -974,7 +1096,7 @@ class DB:
         return out
 
     def fetch_latest_weekly_missing(self) -> list[dict]:
-        with self.connect() as con:
+        with self.session() as con:
             ts_row = con.execute("SELECT MAX(ts) FROM weekly_pick_missing").fetchone()
             if not ts_row or ts_row[0] is None:
                 return []
@@ -1020,7 +1142,7 @@ class DB:
     ) -> None:
         ticker = ticker.upper().strip()
         right = right.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 """
                 INSERT OR REPLACE INTO option_features
@@ -1046,7 +1168,7 @@ class DB:
             )
 
     def fetch_latest_option_features(self, limit: int = 200) -> list[dict]:
-        with self.connect() as con:
+        with self.session() as con:
             rows = con.execute(
                 """
                 SELECT ts, ticker, expiry, right, strike, stock_price, option_mid, spread_pct, intrinsic, time_value, delta_gain, recommendation, rationale, snapshot_status
@@ -1086,7 +1208,7 @@ class DB:
             "ts, lane, ann_vol, max_drawdown, sharpe_like, CoveredCall_Suitability, "
             "premium_heur_100, premium_ml_100, premium_yield_heur, premium_yield_ml, fft_entropy, fractal_roughness"
         )
-        with self.connect() as con:
+        with self.session() as con:
             row = con.execute(
                 f"SELECT {cols} FROM oced_scores WHERE ticker=? ORDER BY ts DESC LIMIT 1",
                 (ticker,),
@@ -1120,7 +1242,7 @@ class DB:
         expected_move_5d: float | None,
     ) -> None:
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 """
                 INSERT OR REPLACE INTO stock_ml_signals
@@ -1132,7 +1254,7 @@ class DB:
 
     def get_latest_stock_ml(self, ticker: str) -> dict | None:
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             row = con.execute(
                 "SELECT ts, price, vol_forecast_5d, downside_risk_5d, regime_score, expected_move_5d FROM stock_ml_signals WHERE ticker=? ORDER BY ts DESC LIMIT 1",
                 (ticker,),
@@ -1161,7 +1283,7 @@ class DB:
         reason: str,
         sources_json: str | None = None,
     ) -> None:
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 """
                 INSERT INTO promotions(ts, ticker, expiry, strike, lane, seed, decision, reason, sources_json)
@@ -1171,7 +1293,7 @@ class DB:
             )
 
     def list_promotions(self, limit: int = 100) -> list[dict]:
-        with self.connect() as con:
+        with self.session() as con:
             rows = con.execute(
                 "SELECT ts, ticker, expiry, strike, lane, seed, decision, reason, sources_json FROM promotions ORDER BY ts DESC LIMIT ?",
                 (limit,),
@@ -1192,7 +1314,7 @@ class DB:
         ]
 
     def upsert_outcome(self, row: dict) -> None:
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 """
                 INSERT INTO outcomes(week_ending, ticker, entry_price, entry_ts, expiry, strike, sold_premium_100, buyback_cost_100,
@@ -1224,11 +1346,11 @@ class DB:
         if not tickers:
             return out
         up = [t.upper().strip() for t in tickers if t]
-        placeholders = ",".join(["?"] * len(up))
-        with self.connect() as con:
+        # One bound JSON array instead of IN (?,?,...): a single cached statement for any N.
+        with self.session() as con:
             rows = con.execute(
-                f"SELECT ticker, price, ts, source FROM market_last WHERE ticker IN ({placeholders})",
-                up,
+                "SELECT ticker, price, ts, source FROM market_last WHERE ticker IN (SELECT value FROM json_each(?))",
+                (json.dumps(up),),
             ).fetchall()
         prices = {r[0].upper(): (r[1], r[2], r[3]) for r in rows}
 
@@ -1265,7 +1387,8 @@ class DB:
             clean_rows.append((ticker, expiry, strike, bid, ask, mid, oi, iv, vol, ts))
         if not clean_rows:
             return
-        with self.connect() as con:
+        # session(): chain_fetch calls this from worker threads sharing the connection.
+        with self.session() as con:
             con.executemany(
                 """
                 INSERT OR REPLACE INTO option_chains(ticker, expiry, strike, bid, ask, mid, oi, iv, vol, ts)
@@ -1278,7 +1401,7 @@ class DB:
         """Return cached chain rows if fresh enough."""
         ticker = ticker.upper().strip()
         expiry = expiry.strip()
-        with self.connect() as con:
+        with self.session() as con:
             rows = con.execute(
                 """
                 SELECT strike, bid, ask, mid, oi, iv, vol, ts
@@ -1317,7 +1440,7 @@ class DB:
     ) -> None:
         ticker = ticker.upper().strip()
         right = right.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 """
                 INSERT OR REPLACE INTO option_outcomes(ticker, expiry, right, strike, label, close_price, labeled_ts)
@@ -1339,7 +1462,7 @@ class DB:
             clean.append((t, category))
         if not clean:
             return 0
-        with self.connect() as con:
+        with self.session() as con:
             con.executemany(
                 """
                 INSERT OR REPLACE INTO universe(ticker, category, enabled)
@@ -1354,7 +1477,7 @@ class DB:
         if enabled_only:
             sql += " WHERE enabled=1"
         sql += " ORDER BY ticker ASC"
-        with self.connect() as con:
+        with self.session() as con:
             rows = con.execute(sql).fetchall()
         return [(r[0], r[1]) for r in rows]
 
@@ -1415,12 +1538,22 @@ class DB:
         if not payload:
             return 0
 
-        with self.connect() as con:
+        with self.session() as con:
             con.executemany(
                 """
-                INSERT OR REPLACE INTO options_contracts
+                INSERT INTO options_contracts
                 (ticker, underlying_ticker, contract_type, exercise_style, expiration_date, strike_price, shares_per_contract, primary_exchange, cfi, as_of)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ticker) DO UPDATE SET
+                    underlying_ticker=excluded.underlying_ticker,
+                    contract_type=excluded.contract_type,
+                    exercise_style=excluded.exercise_style,
+                    expiration_date=excluded.expiration_date,
+                    strike_price=excluded.strike_price,
+                    shares_per_contract=excluded.shares_per_contract,
+                    primary_exchange=excluded.primary_exchange,
+                    cfi=excluded.cfi,
+                    as_of=excluded.as_of
                 """,
                 payload,
             )
@@ -1442,7 +1575,7 @@ class DB:
             params.append(contract_filter)
         sql += " ORDER BY strike_price ASC"
 
-        with self.connect() as con:
+        with self.session() as con:
             rows = con.execute(sql, params).fetchall()
 
         return [
@@ -1463,7 +1596,7 @@ class DB:
 
     def price_bar_count(self, ticker: str) -> int:
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             row = con.execute(
                 "SELECT COUNT(*) FROM price_bars_1m WHERE ticker=?",
                 (ticker,),
@@ -1483,17 +1616,17 @@ class DB:
         source: str | None = None,
     ) -> None:
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             con.execute(
                 "INSERT OR REPLACE INTO price_bars_1m(ts, ticker, o, h, l, c, v, source) VALUES(?, ?, ?, ?, ?, ?, ?, ?)",
                 (ts, ticker, o, h, l, c, v, source),
             )
 
-    def insert_option_bars(self, table: str, rows: list[tuple]) -> None:
+    def insert_option_bars(self, table: str, rows: list[tuple], *, con: sqlite3.Connection | None = None) -> None:
         if not rows:
             return
         table_safe = "option_bars_1m" if table == "option_bars_1m" else "option_bars_1d"
-        with self.connect() as con:
+        with nullcontext(con) if con is not None else self.session() as con:
             con.executemany(
                 f"INSERT OR REPLACE INTO {table_safe}(ts, contract, ticker, expiry, right, strike, o, h, l, c, v, transactions) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
                 rows,
@@ -1502,7 +1635,7 @@ class DB:
     def latest_option_bar_date(self, table: str, ticker: str) -> str | None:
         table_safe = "option_bars_1m" if table == "option_bars_1m" else "option_bars_1d"
         ticker = ticker.upper().strip()
-        with self.connect() as con:
+        with self.session() as con:
             row = con.execute(
                 f"SELECT MAX(ts) FROM {table_safe} WHERE ticker=?",
                 (ticker,),
@@ -1510,7 +1643,7 @@ class DB:
             return row[0] if row and row[0] else None
 
     def get_oced_stats(self) -> dict:
-        with self.connect() as con:
+        with self.session() as con:
             rows = con.execute("SELECT COUNT(*), MAX(ts), COUNT(DISTINCT ticker) FROM oced_scores").fetchone()
         return {
             "rows": rows[0] if rows else 0,
@@ -1519,7 +1652,7 @@ class DB:
         }
 
     def get_latest_oced_top(self, n: int = 10) -> list[dict]:
-        with self.connect() as con:
+        with self.session() as con:
             latest_ts_row = con.execute("SELECT MAX(ts) FROM oced_scores").fetchone()
             if not latest_ts_row or latest_ts_row[0] is None:
                 return []
@@ -1551,7 +1684,7 @@ class DB:
         return out
 
     def get_ml_status(self) -> dict:
-        with self.connect() as con:
+        with self.session() as con:
             option_features_count = con.execute("SELECT COUNT(*) FROM option_features").fetchone()[0]
             weekly_picks_count = con.execute("SELECT COUNT(*) FROM weekly_picks").fetchone()[0]
             stock_ml_count = con.execute("SELECT COUNT(*) FROM stock_ml_signals").fetchone()[0]
@@ -5,7 +5,12 @@ import os
 from datetime import datetime, timezone, timedelta
 import json
 
-from .store import DB
+from .store import get_db
+
+try:
+    import orjson  # optional; faster report JSON encode/decode
+except ImportError:
+    orjson = None
 
 BASE_DATA_DIR = Path("data")
 REPORT_DIR = BASE_DATA_DIR / "reports"
@@ -56,27 +61,38 @@ def _table(headers: list[str], rows: list[list[str]]) -> list[str]:
     return out
 
 
+def write_json_report(path: Path, payload) -> Path:
+    """Write a JSON report indented by two spaces, via orjson when installed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(payload, indent=2))
+    return path
+
+
+def read_json_report(path: Path):
+    """Parse a JSON report written by write_json_report; None if missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception:
+        return None
+
+
 def _load_compare() -> dict | None:
-    if MODEL_COMPARE_PATH.exists():
-        try:
-            return json.loads(MODEL_COMPARE_PATH.read_text())
-        except Exception:
-            return None
-    return None
+    return read_json_report(MODEL_COMPARE_PATH)
 
 
 def _load_covered_calls() -> dict | None:
-    if COVERED_CALLS_PATH.exists():
-        try:
-            return json.loads(COVERED_CALLS_PATH.read_text())
-        except Exception:
-            return None
-    return None
+    return read_json_report(COVERED_CALLS_PATH)
 
 
 def write_summary(db_path: str = "data/sqlite/tracker.db", seed: float = 9300.0) -> str:
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    db = DB(db_path)
+    db = get_db(db_path)
 
     # Universe + prices
     universe = db.list_universe(enabled_only=True)
@@ -101,7 +117,7 @@ def write_summary(db_path: str = "data/sqlite/tracker.db", seed: float = 9300.0)
     # Promotions recent (last 24h)
     recent_promos = []
     try:
-        with db.connect() as con:
+        with db.session() as con:
             rows = con.execute(
                 """
                 SELECT ts, ticker, expiry, strike, lane, seed, decision, reason
@@ -128,7 +144,7 @@ def write_summary(db_path: str = "data/sqlite/tracker.db", seed: float = 9300.0)
         recent_promos = []
 
     # Active positions + option health
-    with db.connect() as con:
+    with db.session() as con:
         open_positions = con.execute(
             """
             SELECT ticker, expiry, right, strike, qty, status, opened_ts
@@ -89,7 +89,7 @@ THEME_CSS = """
 def get_stats(db_path):
     db = DB(db_path)
     try:
-        with db.connect() as con:
+        with db.session() as con:
             univ_count = con.execute("SELECT count(*) FROM universe").fetchone()[0]
             oced_count = con.execute("SELECT count(*) FROM oced_scores").fetchone()[0]
             pick_count = con.execute("SELECT count(*) FROM weekly_picks").fetchone()[0]
@@ -1,41 +1,53 @@
 from __future__ import annotations
+import sqlite3
+from contextlib import nullcontext
 from dataclasses import dataclass
 from .store import DB
 
 @dataclass
 class Watchlists:
     db: DB
+
+    def _session(self, con: sqlite3.Connection | None):
+        """Join the caller's ``db.session()`` transaction when given one, else open our own."""
+        return nullcontext(con) if con is not None else self.db.session()
     
-    def remove_ticker(self, ticker: str) -> None:
+    def remove_ticker(self, ticker: str, *, con: sqlite3.Connection | None = None) -> None:
         ticker = ticker.upper().strip()
-        with self.db.connect() as con:
+        with self._session(con) as con:
             con.execute("DELETE FROM tickers WHERE ticker=?", (ticker,))
 
-    def close_contract(self, contract_id: int) -> None:
-        with self.db.connect() as con:
+    def close_contract(self, contract_id: int, *, con: sqlite3.Connection | None = None) -> None:
+        with self._session(con) as con:
             con.execute("UPDATE option_positions SET status='CLOSED' WHERE id=?", (int(contract_id),))
 
 
-    def add_ticker(self, ticker: str) -> None:
-        ticker = ticker.upper().strip()
-        with self.db.connect() as con:
-            con.execute(
-                "INSERT OR REPLACE INTO tickers(ticker, enabled) VALUES(?, 1)",
-                (ticker,),
+    def add_ticker(self, ticker: str, *, con: sqlite3.Connection | None = None) -> None:
+        self.add_tickers([ticker], con=con)
+
+    def add_tickers(self, tickers, *, con: sqlite3.Connection | None = None) -> int:
+        """Enable many tickers in one transaction; returns how many were written."""
+        rows = [(t,) for t in dict.fromkeys(t.upper().strip() for t in tickers) if t]
+        with self._session(con) as con:
+            con.executemany(
+                "INSERT INTO tickers(ticker, enabled) VALUES(?, 1) "
+                "ON CONFLICT(ticker) DO UPDATE SET enabled=1 WHERE enabled=0",
+                rows,
             )
+        return len(rows)
 
-    def disable_ticker(self, ticker: str) -> None:
+    def disable_ticker(self, ticker: str, *, con: sqlite3.Connection | None = None) -> None:
         ticker = ticker.upper().strip()
-        with self.db.connect() as con:
+        with self._session(con) as con:
             con.execute("UPDATE tickers SET enabled=0 WHERE ticker=?", (ticker,))
 
-    def list_tickers(self) -> list[str]:
-        with self.db.connect() as con:
+    def list_tickers(self, *, con: sqlite3.Connection | None = None) -> list[str]:
+        with self._session(con) as con:
             rows = con.execute("SELECT ticker FROM tickers WHERE enabled=1 ORDER BY ticker").fetchall()
         return [r[0] for r in rows]
 
-    def get_position_details(self, position_id: int) -> dict:
-        with self.db.connect() as con:
+    def get_position_details(self, position_id: int, *, con: sqlite3.Connection | None = None) -> dict:
+        with self._session(con) as con:
             row = con.execute(
                 """
                 SELECT shares, stock_basis, premium_open
@@ -63,12 +75,13 @@ class Watchlists:
         shares: int = 100,
         stock_basis: float = 0.0,
         premium_open: float = 0.0,
+        con: sqlite3.Connection | None = None,
     ) -> None:
         ticker = ticker.upper().strip()
         right = right.upper().strip()
         if right not in ("C", "P"):
             raise ValueError("right must be 'C' or 'P'")
-        with self.db.connect() as con:
+        with self._session(con) as con:
             con.execute(
                 """
                 INSERT INTO option_positions(ticker, expiry, right, strike, qty, shares, stock_basis, premium_open)
@@ -86,8 +99,8 @@ class Watchlists:
                 ),
             )
 
-    def list_open_contracts(self):
-        with self.db.connect() as con:
+    def list_open_contracts(self, *, con: sqlite3.Connection | None = None):
+        with self._session(con) as con:
             return con.execute(
                 """
                 SELECT id, ticker, expiry, right, strike, qty, opened_ts
@@ -4,7 +4,7 @@ import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from .store import DB
+from .store import get_db
 
 
 REPORT_DIR = Path("data/reports")
@@ -37,10 +37,10 @@ def _week_ending(dt: datetime) -> str:
 
 
 def compute_outcomes(db_path: str = "data/sqlite/tracker.db") -> list[dict]:
-    db = DB(db_path)
+    db = get_db(db_path)
     week_ending = _week_ending(datetime.now(timezone.utc))
 
-    with db.connect() as con:
+    with db.session() as con:
         promos = con.execute(
             """
             SELECT ts, ticker, expiry, strike, lane, decision, reason
@@ -63,7 +63,7 @@ def compute_outcomes(db_path: str = "data/sqlite/tracker.db") -> list[dict]:
         monday_rank = None
         combined_rank_score = None
 
-        with db.connect() as con:
+        with db.session() as con:
             pick = con.execute(
                 """
                 SELECT price, ts, premium_100, premium_yield, rank, combined_rank_score
@@ -102,7 +102,7 @@ def compute_outcomes(db_path: str = "data/sqlite/tracker.db") -> list[dict]:
         max_adv = None
         if entry_ts:
             try:
-                with db.connect() as con:
+                with db.session() as con:
                     rows = con.execute(
                         """
                         SELECT c FROM price_bars_1m
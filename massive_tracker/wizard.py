@@ -5,7 +5,7 @@ from rich.console import Console
 from rich.prompt import Prompt, Confirm, IntPrompt, FloatPrompt
 from rich.table import Table
 
-from massive_tracker.store import DB
+from massive_tracker.store import get_db
 from .watchlist import Watchlists
 from .run_profile import load_profile, save_profile
 
@@ -41,8 +41,8 @@ def _table_contracts(rows) -> None:
 
 
 def run_wizard(db_path: str = "data/sqlite/tracker.db") -> dict:
-    db = DB(db_path)
-    db.connect().close()
+    db = get_db(db_path)
+    db.connect()
     wl = Watchlists(db)
 
     profile = load_profile()
@@ -59,11 +59,13 @@ def run_wizard(db_path: str = "data/sqlite/tracker.db") -> dict:
     console.print("\n[bold]Manage Watchlist[/bold]")
 
     if Confirm.ask("Add new tickers to watchlist?", default=True):
+        to_add: list[str] = []
         while True:
             t = Prompt.ask("Ticker to add (Enter to stop)", default="").strip()
             if not t:
                 break
-            wl.add_ticker(t)
+            to_add.append(t)
+        wl.add_tickers(to_add)
 
     if tickers and Confirm.ask("Remove/disable any tickers?", default=False):
         while True:
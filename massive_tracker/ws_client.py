@@ -24,16 +24,19 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import json
+import socket
+import sys
 import time
 import threading
 from datetime import datetime, timezone
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 from .config import CFG
-from .store import DB
+from .store import get_db
 
 try:
     import websocket  # websocket-client
@@ -49,14 +52,37 @@ LOG_DIR = Path("data/logs")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 WS_EVENTS_LOG = LOG_DIR / "ws_events.jsonl"
 
+# Channels per subscribe frame; large watchlists go out in a few frames, not one per symbol.
+SUBSCRIBE_CHUNK = 500
+# Kernel send buffer for the WS socket (bytes).
+WS_SNDBUF = 1 << 20
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# Open JSONL logs, kept for the life of the process instead of reopened per event.
+_JSONL_FILES: dict[Path, Any] = {}
+_JSONL_LOCK = threading.Lock()
+
+
 def _append_jsonl(path: Path, obj: dict) -> None:
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    line = json.dumps(obj, ensure_ascii=False) + "\n"
+    with _JSONL_LOCK:
+        f = _JSONL_FILES.get(path)
+        if f is None:
+            # Line-buffered, so every event still reaches disk as it is written.
+            f = _JSONL_FILES[path] = path.open("a", encoding="utf-8", buffering=1)
+        f.write(line)
+
+
+@atexit.register
+def _close_jsonl_files() -> None:
+    with _JSONL_LOCK:
+        for f in _JSONL_FILES.values():
+            f.close()
+        _JSONL_FILES.clear()
 
 
 def _parse_occ_symbol(sym: str) -> tuple[str, str, str, float] | None:
@@ -119,7 +145,10 @@ class MassiveWSClient:
         self.is_authenticated = False
         self.market_mode = "unknown"
 
-        self.market_cache_db = DB(market_cache_db_path) if market_cache_db_path else None
+        # get_db: the trigger engine and run_monitor share this cached connection.
+        self.market_cache_db = get_db(market_cache_db_path) if market_cache_db_path else None
+        # Set whenever a stock bar lands in market_last so pollers can wait instead of sleeping.
+        self.bar_cached = threading.Event()
         
         # Callbacks (user can override)
         self.on_aggregate_minute: Optional[Callable[[dict], None]] = None
@@ -187,6 +216,7 @@ class MassiveWSClient:
         try:
             if occ is None and px is not None:
                 self.market_cache_db.set_market_last(str(sym), ts_iso, px, source="ws:stocks_agg_1m")
+                self.bar_cached.set()
         except Exception as e:
             if self.on_error:
                 self.on_error(e)
@@ -243,11 +273,13 @@ class MassiveWSClient:
         self.ws.send(json.dumps(auth_msg))
         print("[ws] Sent auth")
 
-    def _send_subscribe(self, params: list[str]) -> None:
+    def _send_subscribe(self, params: list[str], chunk: int = SUBSCRIBE_CHUNK) -> None:
+        """Send params as comma-joined subscribe frames of at most ``chunk`` channels each."""
         if not self.ws or not params:
             return
-        sub_msg = {"action": "subscribe", "params": ",".join(params)}
-        self.ws.send(json.dumps(sub_msg))
+        for i in range(0, len(params), chunk):
+            sub_msg = {"action": "subscribe", "params": ",".join(params[i : i + chunk])}
+            self.ws.send(json.dumps(sub_msg))
     
     def subscribe(self, symbols: list[str]):
         """
@@ -276,8 +308,7 @@ class MassiveWSClient:
             self.subscribed_symbols.update(payload)
             print(f"[ws] Queued stock subscriptions: {symbols}")
             return
-        sub_msg = {"action": "subscribe", "params": ",".join(payload)}
-        self.ws.send(json.dumps(sub_msg))
+        self._send_subscribe(payload)
         self.subscribed_symbols.update(payload)
         print(f"[ws] Subscribed to stocks: {len(symbols)} symbols")
 
@@ -289,8 +320,7 @@ class MassiveWSClient:
             self.subscribed_symbols.update(payload)
             print(f"[ws] Queued option subscriptions: {symbols}")
             return
-        sub_msg = {"action": "subscribe", "params": ",".join(payload)}
-        self.ws.send(json.dumps(sub_msg))
+        self._send_subscribe(payload)
         self.subscribed_symbols.update(payload)
         print(f"[ws] Subscribed to options: {len(symbols)} symbols")
     
@@ -376,7 +406,10 @@ class MassiveWSClient:
         )
         
         # Run forever (blocking)
-        self.ws.run_forever(ping_interval=ping_interval)
+        self.ws.run_forever(
+            ping_interval=ping_interval,
+            sockopt=((socket.SOL_SOCKET, socket.SO_SNDBUF, WS_SNDBUF),),
+        )
     
     def run_background(self, ping_interval: int = 30):
         """
@@ -417,10 +450,9 @@ class RealTimeTriggerEngine:
         self.contract_strikes = self._load_contract_strikes()
 
     def _load_contract_strikes(self) -> dict[str, list[float]]:
-        from .store import DB
         from .watchlist import Watchlists
 
-        wl = Watchlists(DB(self.db_path))
+        wl = Watchlists(get_db(self.db_path))
         rows = wl.list_open_contracts()
         strikes: dict[str, list[float]] = defaultdict(list)
         for (_cid, ticker, _expiry, _right, strike, _qty, _opened_ts) in rows:
@@ -512,6 +544,51 @@ def make_monitor_bar_handler(
     return _handler
 
 
+class BufferedBarPrinter:
+    """
+    on_aggregate_minute handler that queues formatted bars and writes them in batches.
+
+    The WS callback only appends to a deque; a daemon thread drains it every
+    ``interval`` seconds with a single stdout write, so a burst of bars across a
+    large watchlist costs one syscall instead of one print per bar.
+    """
+
+    def __init__(self, interval: float = 0.25, out=None):
+        self.interval = interval
+        self.out = out or sys.stdout
+        self._pending: deque[str] = deque()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="bar-printer", daemon=True)
+        self._thread.start()
+        # The drain thread is a daemon; make sure queued bars still reach stdout on exit.
+        atexit.register(self.close)
+
+    def __call__(self, ev: dict) -> None:
+        close = ev.get("c")
+        vol = ev.get("v")
+        if close is None or vol is None:
+            return
+        self._pending.append(f"📊 {ev.get('sym')}: ${close:.2f} vol={vol:,}")
+
+    def flush(self) -> None:
+        batch = []
+        while self._pending:
+            batch.append(self._pending.popleft())
+        if batch:
+            self.out.write("\n".join(batch) + "\n")
+            self.out.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def close(self) -> None:
+        atexit.unregister(self.close)
+        self._stop.set()
+        self._thread.join(timeout=self.interval * 4)
+        self.flush()
+
+
 # Example usage / test
 if __name__ == "__main__":
     def on_bar(event):
@@ -163,8 +163,8 @@ def test_duplicate_code_removed():
         # Verify MassiveS3 is used instead
         assert 'from .s3_flatfiles import MassiveS3' in content, \
             "Should import MassiveS3"
-        assert 'MassiveS3(cfg)' in content, \
-            "Should use MassiveS3 class"
+        assert 'get_s3(cfg)' in content, \
+            "Should use the shared MassiveS3 client"
         print("  ✓ MassiveS3 class used")
     
     # Check cli.py
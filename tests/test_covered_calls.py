@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import massive_tracker.covered_calls as cc
+
+
+def test_rank_keeps_top_n_per_ticker(monkeypatch):
+    def fake_snapshot(ticker: str, expiry: str):
+        mids = {"AAA": [1.0, 3.0, 2.0], "BBB": [0.5, 4.0]}[ticker]
+        return [{"strike": 100.0, "mid": m, "delta": 0.3} for m in mids], "ts", "fake"
+
+    monkeypatch.setattr(cc, "get_option_chain_snapshot", fake_snapshot)
+
+    out = cc.rank_covered_calls(["aaa", "bbb"], ["2099-01-02"], spot_map={"AAA": 100.0, "BBB": 100.0}, top_n_per_ticker=2)
+
+    assert [(r["ticker"], r["mid"]) for r in out["candidates"]] == [
+        ("BBB", 4.0),
+        ("AAA", 3.0),
+        ("AAA", 2.0),
+        ("BBB", 0.5),
+    ]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import pandas as pd
+
+from massive_tracker.flatfile_manager import FlatfileManager
+from massive_tracker.oced import fetch_ohlcv_local_flatfile
+
+
+def _bars(stamps, closes) -> pd.DataFrame:
+    n = len(stamps)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(stamps, utc=True),
+            "open": [1.0] * n,
+            "high": [2.0] * n,
+            "low": [0.5] * n,
+            "close": closes,
+            "volume": [10.0] * n,
+        }
+    )
+
+
+def test_append_merges_month_partitions(tmp_path):
+    ff_dir = tmp_path / "stocks_1m"
+    mgr = FlatfileManager(db_path=str(tmp_path / "tracker.db"), flatfile_dir=ff_dir)
+    mgr.append_to_flatfile("AAPL", _bars(["2024-01-31 14:30", "2024-02-01 14:30"], [1.0, 2.0]), mode="overwrite")
+    mgr.append_to_flatfile("AAPL", _bars(["2024-02-01 14:30", "2024-02-01 14:31"], [3.0, 4.0]))
+
+    assert (ff_dir / "ticker=AAPL" / "date=2024-02" / "part.parquet").exists()
+    n, first, last = mgr.get_bar_stats("AAPL")
+    assert n == 3
+    assert first == dt.datetime(2024, 1, 31, 14, 30, tzinfo=dt.timezone.utc)
+    assert last == dt.datetime(2024, 2, 1, 14, 31, tzinfo=dt.timezone.utc)
+    assert mgr.get_existing_tickers() == ["AAPL"]
+
+
+def test_daily_rollup_prunes_months(tmp_path, monkeypatch):
+    ff_dir = tmp_path / "data" / "flatfiles" / "stocks_1m"
+    mgr = FlatfileManager(db_path=str(tmp_path / "tracker.db"), flatfile_dir=ff_dir)
+    mgr.append_to_flatfile("AAPL", _bars(["2024-01-31 14:30", "2024-02-01 14:30", "2024-02-01 14:31"], [1.0, 3.0, 4.0]))
+    monkeypatch.chdir(tmp_path)
+
+    daily = fetch_ohlcv_local_flatfile("AAPL", since=dt.date(2024, 2, 1))
+
+    assert len(daily) == 1
+    assert daily["close"].tolist() == [4.0]
+    assert daily["volume"].tolist() == [20.0]
+
+
+def test_csv_migration_only_runs_when_asked(tmp_path):
+    ff_dir = tmp_path / "stocks_1m"
+    ff_dir.mkdir()
+    legacy = ff_dir / "AAPL.csv"
+    _bars(["2024-01-31 14:30"], [1.0]).to_csv(legacy, index=False)
+
+    mgr = FlatfileManager(db_path=str(tmp_path / "tracker.db"), flatfile_dir=ff_dir)
+    assert legacy.exists()
+
+    assert mgr.migrate_csv_files() == 1
+    assert not legacy.exists()
+    assert mgr.get_bar_stats("AAPL")[0] == 1
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+from massive_tracker.flatfiles import (
+    export_stock_day_parquet,
+    export_universe_parquet,
+    load_stock_day_file,
+    load_stock_file,
+    read_stock_day_parquet,
+)
+from massive_tracker.store import DB, get_db
+
+
+def _write_day_aggs(path) -> None:
+    with gzip.open(path, "wt") as f:
+        f.write("ticker,volume,open,close,high,low,window_start,transactions\n")
+        f.write("AAPL,100,1,2.5,3,0.5,1700000000000000000,5\n")
+        f.write("ZZZ,10,1,4,3,0.5,1700000000000000000,5\n")
+
+
+def test_load_stock_file_filters_watchlist(tmp_path):
+    src = tmp_path / "2024-01-02.csv.gz"
+    _write_day_aggs(src)
+    db_path = str(tmp_path / "sqlite" / "tracker.db")
+
+    loaded = load_stock_file(src, db_path, ts_hint="2024-01-02", tickers=["aapl", "msft"])
+
+    assert loaded == 1
+    db = DB(db_path)
+    assert db.get_market_last("AAPL") == (2.5, "2024-01-02", "flatfile:stocks_day_aggs")
+    assert db.get_market_last("ZZZ") == (None, None, None)
+
+
+def test_stock_day_parquet_roundtrip(tmp_path):
+    src = tmp_path / "2024-01-02.csv.gz"
+    _write_day_aggs(src)
+    out_dir = tmp_path / "parquet"
+
+    written = export_stock_day_parquet(src, "2024-01-02", tickers=["AAPL", "ZZZ"], out_dir=out_dir)
+
+    assert written == 2
+    assert (out_dir / "ticker=AAPL" / "dt=2024-01-02").is_dir()
+    assert not (out_dir / "ticker=MSFT").exists()
+    df = read_stock_day_parquet("aapl", root=out_dir)
+    assert df is not None
+    assert df["date"].tolist() == ["2024-01-02"]
+    assert df["close"].tolist() == [2.5]
+
+
+def test_load_stock_file_filters_universe_snapshot(tmp_path):
+    src = tmp_path / "2024-01-02.csv.gz"
+    _write_day_aggs(src)
+    db_path = str(tmp_path / "sqlite" / "tracker.db")
+    DB(db_path).upsert_universe([("ZZZ", None)])
+    universe = tmp_path / "universe.parquet"
+
+    assert export_universe_parquet(db_path, universe) == 1
+    loaded = load_stock_file(src, db_path, ts_hint="2024-01-02", universe=universe)
+
+    assert loaded == 1
+    db = DB(db_path)
+    assert db.get_market_last("ZZZ")[0] == 4.0
+    assert db.get_market_last("AAPL") == (None, None, None)
+
+
+def test_load_stock_file_joins_caller_session(tmp_path):
+    src = tmp_path / "2024-01-02.csv.gz"
+    _write_day_aggs(src)
+    db_path = str(tmp_path / "sqlite" / "tracker.db")
+    db = get_db(db_path)
+
+    try:
+        with db.session() as db_con:
+            assert load_stock_file(src, db_path, ts_hint="2024-01-02", db_con=db_con) == 2
+            raise RuntimeError("abort backfill")
+    except RuntimeError:
+        pass
+    assert db.get_market_last("AAPL") == (None, None, None)
+
+    with db.session() as db_con:
+        load_stock_file(src, db_path, ts_hint="2024-01-02", db_con=db_con)
+    assert db.get_market_last("AAPL")[0] == 2.5
+
+
+def test_iter_download_range_yields_in_date_order(tmp_path, monkeypatch):
+    import time
+
+    from massive_tracker import flatfiles
+    from massive_tracker.config import FlatfileConfig
+
+    def fake_download(key, dest, cfg=None):
+        if "2024-01-03" in key:
+            raise FileNotFoundError(key)
+        time.sleep(0.05 if "2024-01-02" in key else 0)  # first day lands last
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(b"x")
+        return dest
+
+    monkeypatch.setattr(flatfiles, "download_key", fake_download)
+    existing = tmp_path / "ds" / "2024" / "01" / "2024-01-05.csv.gz"
+    existing.parent.mkdir(parents=True)
+    existing.write_bytes(b"x")
+    cfg = FlatfileConfig("a", "s", "https://example", "b", "us_stocks_sip", "us_options_opra")
+
+    got = list(flatfiles.iter_download_range("ds", "2024-01-02", "2024-01-05", tmp_path, cfg, workers=4))
+
+    assert [p.name for p in got] == ["2024-01-02.csv.gz", "2024-01-04.csv.gz"]
+
+    got = list(flatfiles.iter_download_range("ds", "2024-01-02", "2024-01-05", tmp_path, cfg, workers=4, include_existing=True))
+
+    assert [p.name for p in got] == ["2024-01-02.csv.gz", "2024-01-04.csv.gz", "2024-01-05.csv.gz"]
+
+
+def test_iter_download_range_skips_unavailable_days(tmp_path, monkeypatch):
+    from massive_tracker import flatfiles
+    from massive_tracker.config import FlatfileConfig
+
+    class FakeS3:
+        def download(self, bucket, key, dest_path):
+            if "2024-01-06" in key:  # Saturday: S3 answers 404
+                return False
+            Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
+            Path(dest_path).write_bytes(b"x")
+            return True
+
+    monkeypatch.setattr(flatfiles, "get_s3", lambda cfg: FakeS3())
+    cfg = FlatfileConfig("a", "s", "https://example", "b", "us_stocks_sip", "us_options_opra")
+
+    got = list(flatfiles.iter_download_range("ds", "2024-01-05", "2024-01-08", tmp_path, cfg, workers=2))
+
+    assert [p.name for p in got] == ["2024-01-05.csv.gz", "2024-01-07.csv.gz", "2024-01-08.csv.gz"]
+    assert all(p.exists() for p in got)
+
+
+def test_load_stock_day_file_feeds_both_outputs(tmp_path):
+    src = tmp_path / "2024-01-02.csv.gz"
+    _write_day_aggs(src)
+    db_path = str(tmp_path / "sqlite" / "tracker.db")
+    out_dir = tmp_path / "parquet"
+
+    loaded, written = load_stock_day_file(src, db_path, "2024-01-02", tickers=["AAPL", "ZZZ"], out_dir=out_dir)
+
+    assert (loaded, written) == (2, 2)
+    assert DB(db_path).get_market_last("ZZZ") == (4.0, "2024-01-02", "flatfile:stocks_day_aggs")
+    df = read_stock_day_parquet("aapl", root=out_dir)
+    assert df is not None
+    assert df["close"].tolist() == [2.5]
+
+
+def test_backfill_keeps_minute_aggs_out_of_day_parquet(tmp_path, monkeypatch):
+    import massive_tracker.flatfiles as flatfiles
+    from massive_tracker import cli
+
+    src = tmp_path / "2024-01-02.csv.gz"
+    _write_day_aggs(src)
+    monkeypatch.setattr(flatfiles, "iter_download_range", lambda *a, **k: iter([src]))
+    monkeypatch.chdir(tmp_path)
+    day_dir = tmp_path / flatfiles.STOCK_DAY_PARQUET_DIR
+
+    cli.flatfile_backfill(dataset="us_stocks_sip/minute_aggs_v1", start="2024-01-02", end="2024-01-02", db_path="sqlite/t.db")
+    assert not day_dir.exists()
+    assert get_db("sqlite/t.db").get_market_last("AAPL")[0] == 2.5
+
+    cli.flatfile_backfill(dataset="us_stocks_sip/day_aggs_v1", start="2024-01-02", end="2024-01-02", db_path="sqlite/t.db")
+    assert (day_dir / "ticker=AAPL" / "dt=2024-01-02").is_dir()
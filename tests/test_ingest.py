@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import gzip
+import json
+import shutil
+
+from massive_tracker.config import FlatfileConfig
+from massive_tracker.flatfiles import read_stock_day_parquet
+from massive_tracker.ingest import ingest_range
+from massive_tracker.store import DB
+
+
+class _DirS3:
+    """Serves flatfile keys from a local directory in place of the Massive bucket."""
+
+    def __init__(self, files: dict[str, str]):
+        self.files = files
+
+    def download(self, bucket: str, key: str, dest_path: str) -> bool:
+        day = key.rsplit("/", 1)[-1].removesuffix(".csv.gz")
+        if day not in self.files:
+            return False
+        shutil.copyfile(self.files[day], dest_path)
+        return True
+
+
+def _day_file(path, close: float) -> str:
+    with gzip.open(path, "wt") as f:
+        f.write("ticker,volume,open,close,high,low,window_start,transactions\n")
+        f.write(f"AAPL,100,1,{close},3,0.5,1700000000000000000,5\n")
+    return str(path)
+
+
+def test_ingest_range_loads_weekdays_and_newest_market_last(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data" / "raw" / "stocks").mkdir(parents=True)
+    files = {
+        "2024-01-05": _day_file(tmp_path / "fri.csv.gz", 1.0),
+        "2024-01-08": _day_file(tmp_path / "mon.csv.gz", 2.0),
+    }
+    cfg = FlatfileConfig("k", "s", "https://files.example", "flatfiles", "us_stocks_sip", "us_options_opra")
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+
+    dates = ingest_range(cfg, db, "2024-01-04", "2024-01-08", workers=3, s3=_DirS3(files))
+
+    assert dates == ["2024-01-05", "2024-01-08"]
+    assert read_stock_day_parquet("AAPL")["close"].tolist() == [1.0, 2.0]
+    assert db.get_market_last("AAPL")[0] == 2.0
+
+
+class _FlakyS3(_DirS3):
+    def download(self, bucket: str, key: str, dest_path: str) -> bool:
+        if "2024-01-05" in key:
+            raise RuntimeError(f"Download failed for {key}: 500")
+        return super().download(bucket, key, dest_path)
+
+
+def test_ingest_range_records_landed_days_when_one_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data" / "raw" / "stocks").mkdir(parents=True)
+    files = {
+        "2024-01-04": _day_file(tmp_path / "thu.csv.gz", 1.0),
+        "2024-01-08": _day_file(tmp_path / "mon.csv.gz", 2.0),
+    }
+    cfg = FlatfileConfig("k", "s", "https://files.example", "flatfiles", "us_stocks_sip", "us_options_opra")
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+
+    dates = ingest_range(cfg, db, "2024-01-04", "2024-01-08", workers=3, s3=_FlakyS3(files))
+
+    assert dates == ["2024-01-04", "2024-01-08"]
+    with db.session() as con:
+        (raw,) = con.execute("SELECT last_key FROM ingest_state WHERE dataset='ingest_range'").fetchone()
+    payload = json.loads(raw)
+    assert payload["dates"] == ["2024-01-04", "2024-01-08"]
+    assert list(payload["failed"]) == ["2024-01-05"]
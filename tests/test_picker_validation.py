@@ -94,7 +94,7 @@ def test_picker_validation_missing_logged(db: DB):
     run_weekly_picker(db_path=str(DB_PATH), top_n=20)
     
     # Check that missing table exists and has schema
-    with db.connect() as con:
+    with db.session() as con:
         row = con.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='weekly_pick_missing'"
         ).fetchone()
@@ -112,7 +112,7 @@ def test_picker_validation_missing_logged(db: DB):
 
 def test_audit_math_table_exists(db: DB):
     """Ensure audit_math table exists for failure tracking."""
-    with db.connect() as con:
+    with db.session() as con:
         row = con.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='audit_math'"
         ).fetchone()
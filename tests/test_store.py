@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+
+from massive_tracker.store import DB
+
+
+def test_connect_reuses_and_reopens(tmp_path):
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+    con = db.connect()
+    assert db.connect() is con
+    assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert con.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert con.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    con.close()
+    reopened = db.connect()
+    assert reopened is not con
+    assert reopened.execute("SELECT COUNT(*) FROM tickers").fetchone()[0] == 0
+
+
+def test_log_events_upserts_in_place(tmp_path):
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+    db.log_events([("ingest_daily", {"date": "2024-01-02"}), ("ingest_options", {"date": "2024-01-02"})])
+    db.log_event("ingest_daily", {"date": "2024-01-03"})
+
+    rows = dict(db.connect().execute("SELECT dataset, last_key FROM ingest_state").fetchall())
+    assert rows == {
+        "ingest_daily": '{"date": "2024-01-03"}',
+        "ingest_options": '{"date": "2024-01-02"}',
+    }
+
+
+def test_session_groups_watchlist_writes(tmp_path):
+    from massive_tracker.watchlist import Watchlists
+
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+    wl = Watchlists(db)
+    try:
+        with db.session() as con:
+            wl.add_tickers(["aapl", "msft"], con=con)
+            wl.disable_ticker("MSFT", con=con)
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert wl.list_tickers() == []
+
+    with db.session() as con:
+        wl.add_tickers(["aapl", "msft"], con=con)
+        wl.disable_ticker("MSFT", con=con)
+    assert wl.list_tickers() == ["AAPL"]
+
+
+def test_add_tickers_reenables_without_rewriting(tmp_path):
+    from massive_tracker.watchlist import Watchlists
+
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+    wl = Watchlists(db)
+    wl.add_tickers(["aapl"])
+    db.connect().execute("UPDATE tickers SET added_ts='2000-01-01', enabled=0")
+
+    wl.add_tickers(["AAPL"])
+
+    assert db.connect().execute("SELECT ticker, enabled, added_ts FROM tickers").fetchall() == [
+        ("AAPL", 1, "2000-01-01")
+    ]
+
+
+def test_deferred_indexes_rebuilds_after_load(tmp_path):
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+    con = db.connect()
+    con.execute("CREATE INDEX idx_ob1d_ticker ON option_bars_1d(ticker)")
+
+    def index_names():
+        rows = con.execute("SELECT name FROM sqlite_master WHERE type='index' AND sql IS NOT NULL AND tbl_name='option_bars_1d'")
+        return [r[0] for r in rows]
+
+    with db.deferred_indexes("option_bars_1d"):
+        assert index_names() == []
+        db.insert_option_bars("option_bars_1d", [("2024-01-02", "O:X", "X", "2024-01-19", "C", 1.0, 1, 1, 1, 1, 1, 1)])
+
+    assert index_names() == ["idx_ob1d_ticker"]
+
+
+def test_count_market_last_present(tmp_path):
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+    db.set_market_last("AAPL", "2024-01-02T00:00:00+00:00", 1.0)
+    db.set_market_last("MSFT", "2024-01-02T00:00:00+00:00", 2.0)
+
+    assert db.count_market_last_present(["aapl", "MSFT", "NVDA"]) == 2
+    assert db.count_market_last_present([]) == 0
+
+
+def test_helper_commit_cannot_flush_another_threads_session(tmp_path):
+    db = DB(str(tmp_path / "sqlite" / "tracker.db"))
+    real = db.connect()
+    inside, go, helper_done = threading.Event(), threading.Event(), threading.Event()
+
+    class PausingCon:
+        """Shared-connection stand-in that parks the helper thread mid-statement."""
+
+        def __getattr__(self, name):
+            return getattr(real, name)
+
+        def __enter__(self):
+            real.__enter__()
+            return self
+
+        def __exit__(self, *exc):
+            return real.__exit__(*exc)
+
+        def execute(self, *args):
+            if threading.current_thread().name == "helper":
+                inside.set()
+                go.wait(5)
+            return real.execute(*args)
+
+    db._con = PausingCon()
+
+    def helper():
+        db.set_market_last("MSFT", "2024-01-02T00:00:00+00:00", 2.0)
+        helper_done.set()
+
+    def aborted_session():
+        try:
+            with db.session() as con:
+                con.execute("INSERT INTO tickers(ticker, enabled) VALUES('AAPL', 1)")
+                helper_done.wait(0.5)
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+
+    helper_thread = threading.Thread(target=helper, name="helper")
+    helper_thread.start()
+    assert inside.wait(5)
+    session_thread = threading.Thread(target=aborted_session)
+    session_thread.start()
+    session_thread.join(0.3)
+    go.set()
+    helper_thread.join(5)
+    session_thread.join(5)
+
+    assert real.execute("SELECT COUNT(*) FROM tickers").fetchone()[0] == 0
+    assert real.execute("SELECT price FROM market_last WHERE ticker='MSFT'").fetchone() == (2.0,)
@@ -5,3 +5,15 @@ from massive_tracker import summary
 
 def test_fmt_returns_na_for_none():
     assert summary._fmt(None) == "N/A"
+
+
+def test_json_report_roundtrip_with_and_without_orjson(tmp_path, monkeypatch):
+    payload = {"baseline": {"AAPL": {"decision": "promote", "strike": 200.0}}, "changes": []}
+    fast = summary.write_json_report(tmp_path / "fast" / "r.json", payload)
+
+    monkeypatch.setattr(summary, "orjson", None)
+    slow = summary.write_json_report(tmp_path / "slow" / "r.json", payload)
+
+    assert summary.read_json_report(fast) == payload
+    assert fast.read_text() == slow.read_text()
+    assert summary.read_json_report(tmp_path / "missing.json") is None
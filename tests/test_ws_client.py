@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import io
+import json
+
+from massive_tracker.ws_client import BufferedBarPrinter, MassiveWSClient
+
+
+def test_buffered_bar_printer_batches_writes():
+    out = io.StringIO()
+    printer = BufferedBarPrinter(interval=60, out=out)
+    printer({"sym": "AAPL", "c": 1.5, "v": 1000})
+    printer({"sym": "MSFT", "c": 2.0, "v": 20})
+    printer({"sym": "BAD", "c": None, "v": 1})
+    assert out.getvalue() == ""
+
+    printer.close()
+
+    assert out.getvalue() == "📊 AAPL: $1.50 vol=1,000\n📊 MSFT: $2.00 vol=20\n"
+
+
+def test_subscribe_sends_chunked_frames():
+    sent: list[str] = []
+    client = MassiveWSClient(api_key="test_key")
+    client.ws = type("FakeWS", (), {"send": lambda self, msg: sent.append(msg)})()
+    client.is_authenticated = True
+
+    client._send_subscribe([f"AM.S:T{i}" for i in range(5)], chunk=2)
+
+    assert [json.loads(m)["params"] for m in sent] == ["AM.S:T0,AM.S:T1", "AM.S:T2,AM.S:T3", "AM.S:T4"]
+
+
+def test_append_jsonl_keeps_one_handle_per_log(tmp_path):
+    from massive_tracker import ws_client
+
+    log = tmp_path / "events.jsonl"
+    ws_client._append_jsonl(log, {"ts": ws_client._utc_now(), "n": 1})
+    handle = ws_client._JSONL_FILES[log]
+    ws_client._append_jsonl(log, {"n": 2})
+
+    assert ws_client._JSONL_FILES[log] is handle
+    rows = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [r["n"] for r in rows] == [1, 2]
+    ws_client._close_jsonl_files()